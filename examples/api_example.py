@@ -41,13 +41,20 @@ async def main():
     Are there any questions about our performance or strategy going forward?
     """
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    # Reuse one pooled client for all calls so keep-alive connections are
+    # shared across health/submit/status/summary/search/stats requests
+    # instead of paying a TCP handshake per call.
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    ) as client:
         print("🚀 Starting transcript summarization example...")
-        
+
         # 1. Check health
         print("\n1. Checking API health...")
         try:
-            health_response = await client.get(f"{base_url}/health")
+            health_response = await client.get("/health")
             health_response.raise_for_status()
             health_data = health_response.json()
             print(f"   Status: {health_data['status']}")
@@ -60,7 +67,7 @@ async def main():
         print("\n2. Submitting transcript for summarization...")
         try:
             summarize_response = await client.post(
-                f"{base_url}/summarize",
+                "/summarize",
                 json={
                     "text": transcript,
                     "summary_type": "comprehensive"
@@ -75,49 +82,59 @@ async def main():
             print(f"   ❌ Summarization request failed: {e}")
             return
         
-        # 3. Monitor task status
+        # 3. Monitor task status with adaptive backoff: poll quickly while
+        # the task makes progress, back off towards 15s while it is idle.
         print("\n3. Monitoring task progress...")
-        max_attempts = 60  # 5 minutes
-        attempt = 0
-        
-        while attempt < max_attempts:
+        deadline = time.monotonic() + 300  # 5 minutes
+        delay = 1.0
+        prev_progress = -1
+        completed = False
+
+        while time.monotonic() < deadline:
             try:
-                status_response = await client.get(f"{base_url}/status/{task_id}")
+                status_response = await client.get(f"/status/{task_id}")
                 status_response.raise_for_status()
                 status_data = status_response.json()
-                
+
                 status = status_data["status"]
                 progress = status_data.get("progress")
-                
+
                 if progress is not None:
                     print(f"   📊 Status: {status} ({progress}%)")
                 else:
                     print(f"   📊 Status: {status}")
-                
+
                 if status == "completed":
                     print("   ✅ Summarization completed!")
+                    completed = True
                     break
                 elif status == "failed":
                     error_msg = status_data.get("error_message", "Unknown error")
                     print(f"   ❌ Summarization failed: {error_msg}")
                     return
-                
-                await asyncio.sleep(5)
-                attempt += 1
-                
+
+                # Back off while nothing changes, reset when progress advances
+                if progress == prev_progress:
+                    delay = min(delay * 1.5, 15.0)
+                else:
+                    delay = 1.0
+                    prev_progress = progress
+
+                await asyncio.sleep(delay)
+
             except Exception as e:
                 print(f"   ❌ Status check failed: {e}")
-                await asyncio.sleep(5)
-                attempt += 1
-        
-        if attempt >= max_attempts:
+                delay = min(delay * 1.5, 15.0)
+                await asyncio.sleep(delay)
+
+        if not completed:
             print("   ⏰ Timeout waiting for completion")
             return
         
         # 4. Get the summary
         print("\n4. Retrieving summary...")
         try:
-            summary_response = await client.get(f"{base_url}/summary/{task_id}")
+            summary_response = await client.get(f"/summary/{task_id}")
             summary_response.raise_for_status()
             summary_data = summary_response.json()
             
@@ -145,7 +162,7 @@ async def main():
         print("\n5. Searching for similar summaries...")
         try:
             search_response = await client.get(
-                f"{base_url}/search",
+                "/search",
                 params={"query": "quarterly financial results", "limit": 3}
             )
             search_response.raise_for_status()
@@ -162,7 +179,7 @@ async def main():
         # 6. Get application stats
         print("\n6. Getting application statistics...")
         try:
-            stats_response = await client.get(f"{base_url}/stats")
+            stats_response = await client.get("/stats")
             stats_response.raise_for_status()
             stats_data = stats_response.json()
             
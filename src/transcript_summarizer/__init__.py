@@ -4,11 +4,19 @@ __version__ = "0.1.0"
 __author__ = "kstv364"
 __email__ = "kstv364@example.com"
 
-from .core.summarizer import TranscriptSummarizer
-from .models.schemas import SummarizationRequest, SummarizationResponse
-
 __all__ = [
     "TranscriptSummarizer",
     "SummarizationRequest",
     "SummarizationResponse",
 ]
+
+
+def __getattr__(name):
+    """Lazily resolve re-exports so importing the package stays cheap."""
+    if name == "TranscriptSummarizer":
+        from .core.summarizer import TranscriptSummarizer
+        return TranscriptSummarizer
+    if name in ("SummarizationRequest", "SummarizationResponse"):
+        from .models import schemas
+        return getattr(schemas, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
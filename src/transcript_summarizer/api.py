@@ -1,13 +1,19 @@
 """FastAPI application for the transcript summarizer API."""
 
+import asyncio
+import codecs
+import json
 import time
 from datetime import datetime
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, List
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, UploadFile, File, Form
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+import redis.asyncio as aioredis
 import structlog
 from prometheus_client import Counter, Histogram, generate_latest, CONTENT_TYPE_LATEST
 from starlette.responses import Response
@@ -16,7 +22,9 @@ from .config.settings import get_settings
 from .models.schemas import (
     SummarizationRequest,
     SummarizationResponse,
+    SummarizationResult,
     TaskStatusResponse,
+    TaskStatusBatchRequest,
     HealthResponse,
     ErrorResponse,
     TaskStatus,
@@ -28,9 +36,63 @@ from .utils.vtt_parser import VTTParser, is_valid_vtt
 
 logger = structlog.get_logger(__name__)
 
+# Shared parser instance; VTTParser is stateless and its cleaning regexes
+# are compiled once at class level, so per-request construction is wasted
+_vtt_parser = VTTParser()
+
+# Upload size limit for /summarize/upload
+_MAX_UPLOAD_SIZE = 10 * 1024 * 1024  # 10MB
+
+# Short-lived cache for expensive status lookups. Celery inspect() is a
+# synchronous broadcast RPC to every worker, so /health and /stats memoize
+# results briefly instead of hitting the broker on every scrape.
+_STATUS_CACHE_TTL = 5.0
+_status_cache: Dict[str, Any] = {}
+
+
+async def _cached_status(key: str, produce):
+    """Return a cached value for ``key``, recomputing via produce() on expiry."""
+    cached = _status_cache.get(key)
+    if cached and time.monotonic() < cached[1]:
+        return cached[0]
+
+    value = await produce()
+    _status_cache[key] = (value, time.monotonic() + _STATUS_CACHE_TTL)
+    return value
+
+
+def _in_executor(func):
+    """Run a blocking callable in the default thread pool."""
+    return asyncio.get_running_loop().run_in_executor(None, func)
+
+
+def _construct_result(meta: Dict[str, Any]) -> SummarizationResult:
+    """Rehydrate a worker result dict without re-validation.
+
+    model_construct skips coercion, so created_at — serialized to an ISO
+    string by the backend — must be turned back into a datetime or the
+    typed field emits a serialization warning on every status response.
+    """
+    created_at = meta.get("created_at")
+    if isinstance(created_at, str):
+        meta = {**meta, "created_at": datetime.fromisoformat(created_at)}
+    return SummarizationResult.model_construct(**meta)
+
+
+@lru_cache(maxsize=16)
+def _coerce_summary_type(value: str) -> SummaryType:
+    """Convert a summary type string to its enum, memoized.
+
+    The enum value set is tiny, so caching sidesteps the member scan in
+    ``SummaryType.__call__`` on every upload. Raises ValueError for
+    unknown values, same as the enum constructor.
+    """
+    return SummaryType(value)
+
+
 # Prometheus metrics
 request_count = Counter("http_requests_total", "Total HTTP requests", ["method", "endpoint"])
-request_duration = Histogram("http_request_duration_seconds", "HTTP request duration")
+request_duration = Histogram("http_request_duration_seconds", "HTTP request duration", ["method", "endpoint"])
 summarization_count = Counter("summarizations_total", "Total summarizations", ["summary_type"])
 summarization_duration = Histogram("summarization_duration_seconds", "Summarization duration")
 
@@ -59,7 +121,8 @@ app = FastAPI(
     title=settings.api_title,
     version=settings.api_version,
     description="API for summarizing transcripts using Ollama and LangChain",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -72,6 +135,26 @@ app.add_middleware(
 )
 
 
+# Middleware guarding /summarize body size
+@app.middleware("http")
+async def body_size_guard(request, call_next):
+    """Reject oversized /summarize bodies from Content-Length before parsing."""
+    if request.url.path == "/summarize":
+        content_length = request.headers.get("content-length")
+        # UTF-8 worst case: four bytes per transcript character
+        if content_length and content_length.isdigit() and \
+                int(content_length) > settings.max_text_length * 4:
+            return JSONResponse(
+                status_code=413,
+                content={
+                    "detail": f"Text too long. Maximum length is "
+                              f"{settings.max_text_length} characters."
+                }
+            )
+
+    return await call_next(request)
+
+
 # Middleware for metrics
 @app.middleware("http")
 async def metrics_middleware(request, call_next):
@@ -79,11 +162,17 @@ async def metrics_middleware(request, call_next):
     start_time = time.time()
     
     response = await call_next(request)
-    
+
     duration = time.time() - start_time
-    request_count.labels(method=request.method, endpoint=request.url.path).inc()
-    request_duration.observe(duration)
-    
+
+    # Label by the matched route template, not the raw path — raw paths
+    # contain task ids and would create an unbounded number of series
+    route = request.scope.get("route")
+    endpoint = route.path if route else "unmatched"
+
+    request_count.labels(method=request.method, endpoint=endpoint).inc()
+    request_duration.labels(method=request.method, endpoint=endpoint).observe(duration)
+
     return response
 
 
@@ -94,10 +183,10 @@ async def global_exception_handler(request, exc):
     
     return JSONResponse(
         status_code=500,
-        content=ErrorResponse(
+        content=jsonable_encoder(ErrorResponse(
             error="internal_server_error",
             message="An unexpected error occurred"
-        ).dict()
+        ))
     )
 
 
@@ -109,45 +198,40 @@ async def summarize_transcript(request: SummarizationRequest) -> SummarizationRe
     This endpoint accepts a transcript and queues it for processing.
     Use the returned task_id to check status and retrieve the summary.
     """
-    try:
-        logger.info("Received summarization request", 
-                   text_length=len(request.text), 
-                   summary_type=request.summary_type)
-        
-        # Validate text length
-        if len(request.text) > settings.max_text_length:
-            raise HTTPException(
-                status_code=413,
-                detail=f"Text too long. Maximum length is {settings.max_text_length} characters."
-            )
-        
-        # Submit task to Celery
-        task = celery_app.send_task(
-            "summarize_transcript_task",
-            args=[request.text, request.summary_type.value],
-            queue="summarization"
-        )
-        
-        # Update metrics
-        summarization_count.labels(summary_type=request.summary_type.value).inc()
-        
-        logger.info("Submitted summarization task", task_id=task.id)
-        
-        # Estimate completion time based on text length
-        estimated_time = max(30, len(request.text) // 1000)  # Rough estimate
-        
-        return SummarizationResponse(
-            task_id=task.id,
-            status=TaskStatus.PENDING,
-            message="Summarization task submitted successfully",
-            estimated_completion_time=estimated_time
+    text_length = len(request.text)
+
+    logger.info("Received summarization request",
+               text_length=text_length,
+               summary_type=request.summary_type)
+
+    # Validate text length
+    if text_length > settings.max_text_length:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Text too long. Maximum length is {settings.max_text_length} characters."
         )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Failed to submit summarization task", error=str(e))
-        raise HTTPException(status_code=500, detail="Failed to submit summarization task")
+
+    # Submit task to Celery
+    task = celery_app.send_task(
+        "summarize_transcript_task",
+        args=[request.text, request.summary_type.value],
+        queue="summarization"
+    )
+
+    # Update metrics
+    summarization_count.labels(summary_type=request.summary_type.value).inc()
+
+    logger.info("Submitted summarization task", task_id=task.id)
+
+    # Estimate completion time based on text length
+    estimated_time = max(30, text_length // 1000)  # Rough estimate
+
+    return SummarizationResponse(
+        task_id=task.id,
+        status=TaskStatus.PENDING,
+        message="Summarization task submitted successfully",
+        estimated_completion_time=estimated_time
+    )
 
 
 @app.post("/summarize/upload", response_model=SummarizationResponse)
@@ -174,30 +258,53 @@ async def summarize_uploaded_file(
                 detail="Unsupported file type. Please upload .vtt, .txt, or .text files"
             )
         
-        # Read file content
-        content = await file.read()
-        
-        # Check file size (10MB limit)
-        if len(content) > 10 * 1024 * 1024:
+        # Reject oversized uploads up front from the declared size; the
+        # streamed check below still covers clients that omit or understate
+        # Content-Length
+        if file.size and file.size > _MAX_UPLOAD_SIZE:
             raise HTTPException(
                 status_code=413,
                 detail="File too large. Maximum size is 10MB"
             )
-        
+
+        # Stream the file in chunks, enforcing the size limit as bytes
+        # arrive and decoding incrementally instead of buffering the raw
+        # bytes and decoding a second full copy afterwards
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        decoded_parts = []
+        bytes_read = 0
+
         try:
-            # Decode content
-            text_content = content.decode('utf-8')
+            while True:
+                chunk = await file.read(64 * 1024)
+                if not chunk:
+                    decoded_parts.append(decoder.decode(b'', final=True))
+                    break
+
+                bytes_read += len(chunk)
+                if bytes_read > _MAX_UPLOAD_SIZE:
+                    raise HTTPException(
+                        status_code=413,
+                        detail="File too large. Maximum size is 10MB"
+                    )
+
+                decoded_parts.append(decoder.decode(chunk))
         except UnicodeDecodeError:
             raise HTTPException(
                 status_code=400,
                 detail="File must be UTF-8 encoded"
             )
+
+        text_content = "".join(decoded_parts)
         
         # Extract transcript text
         if file_ext == 'vtt':
             try:
-                parser = VTTParser()
-                transcript_text = parser.parse_vtt_content(text_content)
+                # CPU-bound string work; keep it off the event loop so a
+                # large upload doesn't stall concurrent requests
+                transcript_text = await _in_executor(
+                    lambda: _vtt_parser.parse_vtt_content(text_content)
+                )
                 
                 if not transcript_text.strip():
                     raise HTTPException(
@@ -235,7 +342,7 @@ async def summarize_uploaded_file(
         
         # Validate summary type
         try:
-            summary_type_enum = SummaryType(summary_type)
+            summary_type_enum = _coerce_summary_type(summary_type)
         except ValueError:
             raise HTTPException(
                 status_code=400,
@@ -290,55 +397,160 @@ async def get_task_status(task_id: str) -> TaskStatusResponse:
     
     Returns the current status, progress, and result if completed.
     """
+    # Get task result from Celery
+    task_result = celery_app.AsyncResult(task_id)
+
+    # Determine status
+    if task_result.state == "PENDING":
+        status = TaskStatus.PENDING
+        progress = None
+        result = None
+        error_message = None
+    elif task_result.state == "PROCESSING":
+        status = TaskStatus.PROCESSING
+        progress = task_result.info.get("progress", 0) if task_result.info else 0
+        result = None
+        error_message = None
+    elif task_result.state == "SUCCESS":
+        status = TaskStatus.COMPLETED
+        progress = 100
+        # Rehydrate without re-validation — the dict came from our own
+        # worker, and this runs on every client's status poll
+        result = _construct_result(task_result.result) if task_result.result else None
+        error_message = None
+    elif task_result.state == "FAILURE":
+        status = TaskStatus.FAILED
+        progress = None
+        result = None
+        error_message = str(task_result.info) if task_result.info else "Task failed"
+    else:
+        status = TaskStatus.PENDING
+        progress = None
+        result = None
+        error_message = None
+
+    return TaskStatusResponse(
+        task_id=task_id,
+        status=status,
+        progress=progress,
+        result=result,
+        error_message=error_message
+    )
+
+
+
+@app.post("/status/batch", response_model=List[TaskStatusResponse])
+async def get_task_status_batch(request: TaskStatusBatchRequest) -> List[TaskStatusResponse]:
+    """
+    Get the status of several summarization tasks in one call.
+
+    Fetches all task metadata from the result backend with a single MGET
+    instead of one round-trip per task, for dashboards polling many tasks.
+    """
     try:
-        # Get task result from Celery
-        task_result = celery_app.AsyncResult(task_id)
-        
-        # Determine status
-        if task_result.state == "PENDING":
-            status = TaskStatus.PENDING
-            progress = None
-            result = None
-            error_message = None
-        elif task_result.state == "PROCESSING":
-            status = TaskStatus.PROCESSING
-            progress = task_result.info.get("progress", 0) if task_result.info else 0
-            result = None
-            error_message = None
-        elif task_result.state == "SUCCESS":
-            status = TaskStatus.COMPLETED
-            progress = 100
-            # Convert result dict back to SummarizationResult
-            if task_result.result:
-                from .models.schemas import SummarizationResult
-                result = SummarizationResult(**task_result.result)
+        keys = [f"celery-task-meta-{task_id}" for task_id in request.task_ids]
+        raw_metas = await _in_executor(lambda: celery_app.backend.client.mget(keys))
+
+        responses = []
+        for task_id, raw in zip(request.task_ids, raw_metas):
+            if raw is None:
+                responses.append(
+                    TaskStatusResponse(task_id=task_id, status=TaskStatus.PENDING)
+                )
+                continue
+
+            meta = json.loads(raw)
+            state = meta.get("status")
+            # Celery stores custom-state info and failure details in "result"
+            info = meta.get("result")
+
+            if state == "PROCESSING":
+                progress = info.get("progress", 0) if isinstance(info, dict) else 0
+                responses.append(TaskStatusResponse(
+                    task_id=task_id,
+                    status=TaskStatus.PROCESSING,
+                    progress=progress
+                ))
+            elif state == "SUCCESS":
+                result = _construct_result(info) if info else None
+                responses.append(TaskStatusResponse(
+                    task_id=task_id,
+                    status=TaskStatus.COMPLETED,
+                    progress=100,
+                    result=result
+                ))
+            elif state == "FAILURE":
+                responses.append(TaskStatusResponse(
+                    task_id=task_id,
+                    status=TaskStatus.FAILED,
+                    error_message=str(info) if info else "Task failed"
+                ))
             else:
-                result = None
-            error_message = None
-        elif task_result.state == "FAILURE":
-            status = TaskStatus.FAILED
-            progress = None
-            result = None
-            error_message = str(task_result.info) if task_result.info else "Task failed"
-        else:
-            status = TaskStatus.PENDING
-            progress = None
-            result = None
-            error_message = None
-        
-        return TaskStatusResponse(
-            task_id=task_id,
-            status=status,
-            progress=progress,
-            result=result,
-            error_message=error_message
-        )
-        
+                responses.append(
+                    TaskStatusResponse(task_id=task_id, status=TaskStatus.PENDING)
+                )
+
+        return responses
+
     except Exception as e:
-        logger.error("Failed to get task status", task_id=task_id, error=str(e))
+        logger.error("Failed to get batch task status", error=str(e))
         raise HTTPException(status_code=500, detail="Failed to get task status")
 
 
+@app.get("/status/{task_id}/stream")
+async def stream_task_status(task_id: str):
+    """
+    Stream task state transitions as server-sent events.
+
+    Subscribes to the Celery result backend channel for the task, so state
+    changes are pushed to the client instead of being polled. A heartbeat
+    comment is sent every 30 seconds to keep idle connections alive.
+    """
+    async def event_stream():
+        redis_client = aioredis.from_url(settings.celery_result_backend)
+        pubsub = redis_client.pubsub()
+
+        try:
+            # The Redis result backend publishes task metadata on this channel
+            await pubsub.subscribe(f"celery-task-meta-{task_id}")
+
+            # Emit the current state first so clients that connect late
+            # don't have to wait for the next transition. Reading .state
+            # is a blocking backend round-trip, so keep it off the loop.
+            task_result = celery_app.AsyncResult(task_id)
+            state = await _in_executor(lambda: task_result.state)
+            yield f"data: {json.dumps({'task_id': task_id, 'status': state})}\n\n"
+
+            if state in ("SUCCESS", "FAILURE"):
+                return
+
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=30.0
+                )
+
+                if message is None:
+                    # Heartbeat to keep the connection alive
+                    yield ": heartbeat\n\n"
+                    continue
+
+                try:
+                    meta = json.loads(message["data"])
+                except (ValueError, TypeError):
+                    continue
+
+                yield f"data: {json.dumps({'task_id': task_id, 'status': meta.get('status')})}\n\n"
+
+                if meta.get("status") in ("SUCCESS", "FAILURE"):
+                    break
+
+        finally:
+            await pubsub.aclose()
+            await redis_client.aclose()
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @app.get("/summary/{task_id}")
 async def get_summary(task_id: str):
     """
@@ -347,39 +559,40 @@ async def get_summary(task_id: str):
     This endpoint returns the summary if the task is completed,
     or an error if the task is still processing or failed.
     """
-    try:
-        # First check Celery result
-        task_result = celery_app.AsyncResult(task_id)
-        
-        if task_result.state == "SUCCESS" and task_result.result:
-            return task_result.result
-        
-        # If not in Celery, try vector store
-        vector_store = await get_vector_store()
-        result = await vector_store.get_summary(task_id)
-        
-        if result:
-            return result.dict()
-        
-        # Check if task exists but is not completed
-        if task_result.state in ["PENDING", "PROCESSING"]:
-            raise HTTPException(
-                status_code=202,
-                detail="Task is still processing. Check status endpoint for progress."
-            )
-        elif task_result.state == "FAILURE":
-            raise HTTPException(
-                status_code=400,
-                detail=f"Task failed: {task_result.info}"
-            )
-        else:
-            raise HTTPException(status_code=404, detail="Summary not found")
-            
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Failed to get summary", task_id=task_id, error=str(e))
-        raise HTTPException(status_code=500, detail="Failed to retrieve summary")
+    # First check Celery result. Reading state once populates the
+    # AsyncResult meta cache, so the .result access below does not do
+    # a second backend round-trip on the success path.
+    task_result = celery_app.AsyncResult(task_id)
+    state = task_result.state
+
+    if state == "SUCCESS" and task_result.result:
+        return task_result.result
+
+    # Tasks actively running never have a stored summary yet, so don't
+    # hit the vector store for every polling client's follow-up. PENDING
+    # must fall through: Celery reports PENDING for unknown task ids too,
+    # and once result_expires purges the meta the vector store is the
+    # only place the summary still lives.
+    if state == "PROCESSING":
+        raise HTTPException(
+            status_code=202,
+            detail="Task is still processing. Check status endpoint for progress."
+        )
+    elif state == "FAILURE":
+        raise HTTPException(
+            status_code=400,
+            detail=f"Task failed: {task_result.info}"
+        )
+
+    # PENDING or unknown in Celery, try vector store
+    vector_store = await get_vector_store()
+    result = await vector_store.get_summary(task_id)
+
+    if result:
+        return result.dict()
+
+    raise HTTPException(status_code=404, detail="Summary not found")
+
 
 
 @app.get("/search")
@@ -396,23 +609,19 @@ async def search_summaries(
         limit: Maximum number of results (default: 5)
         summary_type: Filter by summary type (optional)
     """
-    try:
-        vector_store = await get_vector_store()
-        results = await vector_store.search_similar_summaries(
-            query_text=query,
-            limit=limit,
-            summary_type=summary_type
-        )
-        
-        return {
-            "query": query,
-            "results": results,
-            "count": len(results)
-        }
-        
-    except Exception as e:
-        logger.error("Failed to search summaries", error=str(e))
-        raise HTTPException(status_code=500, detail="Failed to search summaries")
+    vector_store = await get_vector_store()
+    results = await vector_store.search_similar_summaries(
+        query_text=query,
+        limit=limit,
+        summary_type=summary_type
+    )
+
+    return {
+        "query": query,
+        "results": results,
+        "count": len(results)
+    }
+
 
 
 @app.get("/health", response_model=HealthResponse)
@@ -424,11 +633,14 @@ async def health_check() -> HealthResponse:
     """
     services = {}
     
-    # Check Celery
+    # Check Celery with a bounded ping — inspect() has no timeout and can
+    # hang on a stuck worker, taking the health check down with it
     try:
-        inspect = celery_app.control.inspect()
-        active_workers = inspect.active()
-        if active_workers:
+        replies = await _cached_status(
+            "health_ping",
+            lambda: _in_executor(lambda: celery_app.control.ping(timeout=0.5)),
+        )
+        if replies:
             services["celery"] = "healthy"
         else:
             services["celery"] = "no_workers"
@@ -464,34 +676,39 @@ async def health_check() -> HealthResponse:
 @app.get("/stats")
 async def get_stats():
     """Get application statistics."""
-    try:
-        vector_store = await get_vector_store()
-        stats = await vector_store.get_collection_stats()
-        
-        # Add Celery stats
+    vector_store = await get_vector_store()
+    stats = await _cached_status(
+        "collection_stats", vector_store.get_collection_stats
+    )
+
+    # Add Celery stats (cached; three broker broadcasts otherwise)
+    def _collect_celery_stats():
         inspect = celery_app.control.inspect()
-        celery_stats = {
+        return {
             "active_tasks": len(inspect.active() or {}),
             "scheduled_tasks": len(inspect.scheduled() or {}),
             "reserved_tasks": len(inspect.reserved() or {}),
         }
-        
-        return {
-            "vector_store": stats,
-            "celery": celery_stats,
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        
-    except Exception as e:
-        logger.error("Failed to get stats", error=str(e))
-        raise HTTPException(status_code=500, detail="Failed to get statistics")
+
+    celery_stats = await _cached_status(
+        "celery_stats", lambda: _in_executor(_collect_celery_stats)
+    )
+
+    return {
+        "vector_store": stats,
+        "celery": celery_stats,
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
 
 
 @app.get("/metrics")
 async def get_metrics():
     """Prometheus metrics endpoint."""
+    # Serialization walks every collector; keep it off the event loop
+    content = await _in_executor(generate_latest)
     return Response(
-        content=generate_latest(),
+        content=content,
         media_type=CONTENT_TYPE_LATEST
     )
 
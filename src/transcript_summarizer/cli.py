@@ -2,18 +2,51 @@
 
 import asyncio
 import sys
+import time
 from typing import Optional
 import click
 import structlog
 import os
 
 from .config.settings import get_settings
-from .core.summarizer import create_summarizer
-from .models.schemas import SummaryType
-from .utils.vtt_parser import VTTParser, is_valid_vtt
 
 logger = structlog.get_logger(__name__)
 
+# Cached service clients for the health command. Rebuilding them per call
+# costs a TCP handshake (and AUTH for Redis) every probe; reuse instead
+# and drop the cached client on failure so the next call reconnects.
+_redis_client = None
+_ollama_client = None
+
+# Timestamps of the last successful probes. Frequent health polling
+# (e.g. k8s probes) shouldn't re-PING Redis — or worse, run an LLM
+# generation — when a check just succeeded.
+_HEALTH_OK_TTL = 10.0
+_last_redis_ok_ts = 0.0
+_last_ollama_ok_ts = 0.0
+
+
+def _get_redis(redis_url: str):
+    """Return a cached Redis client, connecting on first use."""
+    global _redis_client
+    if _redis_client is None:
+        import redis
+        _redis_client = redis.from_url(
+            redis_url,
+            socket_connect_timeout=2,
+            socket_keepalive=True,
+        )
+    return _redis_client
+
+
+def _get_ollama(host: str):
+    """Return a cached Ollama async client."""
+    global _ollama_client
+    if _ollama_client is None:
+        from ollama import AsyncClient
+        _ollama_client = AsyncClient(host=host)
+    return _ollama_client
+
 
 @click.group()
 @click.option('--debug', is_flag=True, help='Enable debug mode')
@@ -35,18 +68,22 @@ def cli(debug: bool):
               help='Output file (default: stdout)')
 def summarize(text_file, summary_type: str, output):
     """Summarize a transcript from a file."""
+    # Imported here so --help, serve, worker etc. don't pay the
+    # langchain/summarizer import cost
+    from .core.summarizer import create_summarizer
+    from .utils.vtt_parser import VTTParser
+
     async def _summarize():
         try:
-            # Check if file is VTT format
-            content = text_file.read().strip()
-            text_file.seek(0)  # Reset file pointer
-            
-            if not content:
+            content = text_file.read()
+
+            if not content or content.isspace():
                 click.echo("Error: Input file is empty", err=True)
                 sys.exit(1)
-            
-            # Check if it's a VTT file
-            if text_file.name.endswith('.vtt') or is_valid_vtt(content):
+
+            # Cheap VTT sniff on the head of the file — the spec requires a
+            # WEBVTT header line, so no need to fully parse just to detect
+            if text_file.name.endswith('.vtt') or content[:64].lstrip().startswith('WEBVTT'):
                 click.echo("Detected VTT file, parsing...", err=True)
                 parser = VTTParser()
                 try:
@@ -56,15 +93,19 @@ def summarize(text_file, summary_type: str, output):
                     click.echo(f"Error parsing VTT file: {e}", err=True)
                     sys.exit(1)
             else:
-                text = content
+                text = content.strip()
                 click.echo(f"Processing {len(text)} characters...", err=True)
             
-            # Create summarizer and process
+            # Create summarizer and process, streaming the final summary
+            # to the output as tokens arrive
+            def _write_token(token: str):
+                output.write(token)
+                output.flush()
+
             summarizer = await create_summarizer()
-            result = await summarizer.summarize_transcript(text, summary_type)
-            
-            # Write output
-            output.write(result.summary)
+            result = await summarizer.summarize_transcript(
+                text, summary_type, on_token=_write_token
+            )
             output.write('\n')
             
             # Print stats to stderr
@@ -89,11 +130,14 @@ def serve(host: str, port: int, reload: bool):
     """Start the FastAPI server."""
     import uvicorn
     
+    # "auto" prefers uvloop when importable but still runs where the
+    # optional dependency is absent (it is skipped on Windows installs)
     uvicorn.run(
         "transcript_summarizer.api:app",
         host=host,
         port=port,
-        reload=reload
+        reload=reload,
+        loop="auto"
     )
 
 
@@ -108,7 +152,7 @@ def worker(loglevel: str, concurrency: int):
         'worker',
         f'--loglevel={loglevel}',
         f'--concurrency={concurrency}',
-        '--queues=summarization',
+        '--queues=summarization,health',
     ])
 
 
@@ -122,16 +166,16 @@ def health():
             click.echo("Checking service health...")
             
             # Check Ollama
+            global _ollama_client, _last_ollama_ok_ts
             try:
-                from langchain_ollama import OllamaLLM
-                llm = OllamaLLM(
-                    base_url=settings.ollama_base_url,
-                    model=settings.ollama_model
-                )
-                # Simple test
-                response = llm.invoke("Hello")
+                if time.monotonic() - _last_ollama_ok_ts >= _HEALTH_OK_TTL:
+                    # Simple test
+                    client = _get_ollama(settings.ollama_base_url)
+                    await client.generate(model=settings.ollama_model, prompt="Hello")
+                    _last_ollama_ok_ts = time.monotonic()
                 click.echo("✓ Ollama: Healthy")
             except Exception as e:
+                _ollama_client = None
                 click.echo(f"✗ Ollama: Unhealthy - {e}")
             
             # Check ChromaDB
@@ -147,12 +191,14 @@ def health():
                 click.echo(f"✗ ChromaDB: Unhealthy - {e}")
             
             # Check Redis
+            global _redis_client, _last_redis_ok_ts
             try:
-                import redis
-                r = redis.from_url(settings.redis_url)
-                r.ping()
+                if time.monotonic() - _last_redis_ok_ts >= _HEALTH_OK_TTL:
+                    _get_redis(settings.redis_url).ping()
+                    _last_redis_ok_ts = time.monotonic()
                 click.echo("✓ Redis: Healthy")
             except Exception as e:
+                _redis_client = None
                 click.echo(f"✗ Redis: Unhealthy - {e}")
                 
         except Exception as e:
@@ -222,6 +268,14 @@ def frontend(api_url: str, host: str, port: int, share: bool):
 
 def main():
     """Main entry point for the CLI."""
+    try:
+        # All async commands are I/O-bound; uvloop's libuv event loop cuts
+        # scheduling overhead for free. Not available on Windows.
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     cli()
 
 
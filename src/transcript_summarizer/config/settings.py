@@ -36,6 +36,18 @@ class Settings(BaseSettings):
         description="Overlap between text chunks"
     )
     
+    token_chunking: bool = Field(
+        default=False,
+        env="TOKEN_CHUNKING",
+        description="Size chunks by token count instead of characters"
+    )
+    
+    chunk_size_tokens: int = Field(
+        default=6000,
+        env="CHUNK_SIZE_TOKENS",
+        description="Chunk size in tokens when token chunking is enabled"
+    )
+    
     # Redis Configuration
     redis_url: str = Field(
         default="redis://localhost:6379/0",
@@ -61,6 +73,45 @@ class Settings(BaseSettings):
         env="CHROMA_COLLECTION_NAME",
         description="ChromaDB collection name"
     )
+    chroma_mode: str = Field(
+        default="http",
+        env="CHROMA_MODE",
+        description="ChromaDB access mode: 'http' or 'persistent' (embedded)"
+    )
+    chroma_persistent_path: str = Field(
+        default="./chroma_data",
+        env="CHROMA_PERSISTENT_PATH",
+        description="Storage path for the embedded ChromaDB client"
+    )
+    chroma_unsafe_fast: bool = Field(
+        default=False,
+        env="CHROMA_UNSAFE_FAST",
+        description="Apply write-optimized SQLite pragmas (WAL, NORMAL sync) to the embedded client"
+    )
+
+    chroma_hnsw_space: str = Field(
+        default="cosine",
+        env="CHROMA_HNSW_SPACE",
+        description="Distance function for the HNSW index"
+    )
+
+    chroma_hnsw_m: int = Field(
+        default=32,
+        env="CHROMA_HNSW_M",
+        description="HNSW graph connectivity (memory/recall trade-off)"
+    )
+
+    chroma_hnsw_construction_ef: int = Field(
+        default=100,
+        env="CHROMA_HNSW_CONSTRUCTION_EF",
+        description="HNSW candidate list size at index build time"
+    )
+
+    chroma_hnsw_search_ef: int = Field(
+        default=64,
+        env="CHROMA_HNSW_SEARCH_EF",
+        description="HNSW candidate list size at query time"
+    )
     
     # API Configuration
     api_title: str = Field(
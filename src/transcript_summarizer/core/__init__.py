@@ -1,5 +1,11 @@
 """Core package initialization."""
 
-from .summarizer import TranscriptSummarizer, create_summarizer
-
 __all__ = ["TranscriptSummarizer", "create_summarizer"]
+
+
+def __getattr__(name):
+    """Lazily resolve re-exports so importing the package stays cheap."""
+    if name in __all__:
+        from . import summarizer
+        return getattr(summarizer, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,11 +2,10 @@
 
 import asyncio
 from typing import List, Optional
+import httpx
 import structlog
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_ollama import OllamaLLM
+from ollama import AsyncClient
 from langchain.chains.summarize import load_summarize_chain
-from langchain.schema import Document
 from langchain.chains.combine_documents.stuff import StuffDocumentsChain
 from langchain.chains.llm import LLMChain
 from langchain.prompts import PromptTemplate
@@ -20,144 +19,26 @@ logger = structlog.get_logger(__name__)
 class TranscriptSummarizer:
     """Main summarizer class that handles long transcripts using chunking strategies."""
 
-    def __init__(self):
-        self.settings = get_settings()
-        self.llm = OllamaLLM(
-            base_url=self.settings.ollama_base_url,
-            model=self.settings.ollama_model,
-            temperature=0.1,
-            num_predict=2048,
-        )
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=self.settings.chunk_size,
-            chunk_overlap=self.settings.chunk_overlap,
-            separators=["\n\n", "\n", ". ", " ", ""],
-        )
-        
-    async def summarize_transcript(
-        self, 
-        text: str, 
-        summary_type: str = "comprehensive"
-    ) -> SummarizationResult:
-        """
-        Summarize a transcript using map-reduce strategy for long texts.
-        
-        Args:
-            text: The transcript text to summarize
-            summary_type: Type of summary (comprehensive, brief, key_points)
-            
-        Returns:
-            SummarizationResult with the summary and metadata
-        """
-        logger.info("Starting transcript summarization", 
-                   text_length=len(text), summary_type=summary_type)
-        
-        try:
-            # Split text into chunks
-            documents = self._create_documents(text)
-            
-            if len(documents) == 1:
-                # Single chunk - direct summarization
-                summary = await self._summarize_single_chunk(documents[0], summary_type)
-            else:
-                # Multiple chunks - map-reduce strategy
-                summary = await self._summarize_multiple_chunks(documents, summary_type)
-            
-            result = SummarizationResult(
-                summary=summary,
-                original_length=len(text),
-                summary_length=len(summary),
-                compression_ratio=len(text) / len(summary) if summary else 0,
-                chunk_count=len(documents),
-                summary_type=summary_type
-            )
-            
-            logger.info("Summarization completed", 
-                       chunk_count=len(documents),
-                       compression_ratio=result.compression_ratio)
-            
-            return result
-            
-        except Exception as e:
-            logger.error("Summarization failed", error=str(e))
-            raise
-
-    def _create_documents(self, text: str) -> List[Document]:
-        """Split text into documents."""
-        texts = self.text_splitter.split_text(text)
-        return [Document(page_content=text) for text in texts]
-
-    async def _summarize_single_chunk(self, document: Document, summary_type: str) -> str:
-        """Summarize a single chunk directly."""
-        prompt = self._get_summary_prompt(summary_type)
-        
-        # Run LLM call in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        summary = await loop.run_in_executor(
-            None, 
-            lambda: self.llm.invoke(prompt.format(text=document.page_content))
-        )
-        
-        return summary.strip()
-
-    async def _summarize_multiple_chunks(self, documents: List[Document], summary_type: str) -> str:
-        """Summarize multiple chunks using map-reduce strategy."""
-        # Step 1: Map - Summarize each chunk
-        chunk_summaries = []
-        map_prompt = self._get_map_prompt(summary_type)
-        
-        loop = asyncio.get_event_loop()
-        
-        # Process chunks in batches to avoid overwhelming the model
-        batch_size = 3
-        for i in range(0, len(documents), batch_size):
-            batch = documents[i:i + batch_size]
-            batch_tasks = []
-            
-            for doc in batch:
-                task = loop.run_in_executor(
-                    None,
-                    lambda d=doc: self.llm.invoke(map_prompt.format(text=d.page_content))
-                )
-                batch_tasks.append(task)
-            
-            batch_results = await asyncio.gather(*batch_tasks)
-            chunk_summaries.extend([result.strip() for result in batch_results])
-            
-            # Small delay between batches to be nice to the model
-            await asyncio.sleep(0.5)
-        
-        # Step 2: Reduce - Combine all chunk summaries
-        combined_summaries = "\n\n".join(chunk_summaries)
-        reduce_prompt = self._get_reduce_prompt(summary_type)
-        
-        final_summary = await loop.run_in_executor(
-            None,
-            lambda: self.llm.invoke(reduce_prompt.format(summaries=combined_summaries))
-        )
-        
-        return final_summary.strip()
-
-    def _get_summary_prompt(self, summary_type: str) -> PromptTemplate:
-        """Get prompt template for single chunk summarization."""
-        templates = {
-            "comprehensive": """
+    # Prompt templates are immutable, so build them once at class definition
+    # instead of rebuilding a dict and a PromptTemplate per LLM call
+    _SUMMARY_TEMPLATES = {
+        "comprehensive": """
 Please provide a comprehensive summary of the following transcript. Include all key points, important details, and main themes discussed.
 
 Transcript:
 {text}
 
 Comprehensive Summary:""",
-            
-            "brief": """
+        
+        "brief": """
 Please provide a brief, concise summary of the following transcript. Focus on the most important points only.
 
 Transcript:
 {text}
 
 Brief Summary:""",
-            
-            "key_points": """
+        
+        "key_points": """
 Please extract the key points from the following transcript and present them as a bulleted list.
 
 Transcript:
@@ -165,31 +46,26 @@ Transcript:
 
 Key Points:
 •""",
-        }
-        
-        template = templates.get(summary_type, templates["comprehensive"])
-        return PromptTemplate(template=template, input_variables=["text"])
+    }
 
-    def _get_map_prompt(self, summary_type: str) -> PromptTemplate:
-        """Get prompt template for map phase (chunk summarization)."""
-        templates = {
-            "comprehensive": """
+    _MAP_TEMPLATES = {
+        "comprehensive": """
 Summarize this section of a transcript, preserving all important information and context:
 
 Section:
 {text}
 
 Section Summary:""",
-            
-            "brief": """
+        
+        "brief": """
 Briefly summarize this section of a transcript, focusing only on the most important points:
 
 Section:
 {text}
 
 Brief Section Summary:""",
-            
-            "key_points": """
+        
+        "key_points": """
 Extract the key points from this section of a transcript:
 
 Section:
@@ -197,31 +73,26 @@ Section:
 
 Key Points from this section:
 •""",
-        }
-        
-        template = templates.get(summary_type, templates["comprehensive"])
-        return PromptTemplate(template=template, input_variables=["text"])
+    }
 
-    def _get_reduce_prompt(self, summary_type: str) -> PromptTemplate:
-        """Get prompt template for reduce phase (combining summaries)."""
-        templates = {
-            "comprehensive": """
+    _REDUCE_TEMPLATES = {
+        "comprehensive": """
 Combine the following section summaries into one comprehensive, coherent summary of the entire transcript. Ensure all important information is preserved and well-organized.
 
 Section Summaries:
 {summaries}
 
 Final Comprehensive Summary:""",
-            
-            "brief": """
+        
+        "brief": """
 Combine the following section summaries into one brief, coherent summary of the entire transcript.
 
 Section Summaries:
 {summaries}
 
 Final Brief Summary:""",
-            
-            "key_points": """
+        
+        "key_points": """
 Combine and organize the following key points from different sections into a comprehensive list of key points for the entire transcript. Remove duplicates and organize logically.
 
 Key Points from Sections:
@@ -229,12 +100,274 @@ Key Points from Sections:
 
 Final Key Points:
 •""",
-        }
+    }
+
+    _SUMMARY_PROMPTS = {
+        name: PromptTemplate(template=template, input_variables=["text"])
+        for name, template in _SUMMARY_TEMPLATES.items()
+    }
+    _MAP_PROMPTS = {
+        name: PromptTemplate(template=template, input_variables=["text"])
+        for name, template in _MAP_TEMPLATES.items()
+    }
+    _REDUCE_PROMPTS = {
+        name: PromptTemplate(template=template, input_variables=["summaries"])
+        for name, template in _REDUCE_TEMPLATES.items()
+    }
+
+    # The hot path only ever substitutes one placeholder, so pre-split each
+    # template into (prefix, suffix) and assemble prompts with plain string
+    # concatenation instead of a format() scan over 4KB of chunk text
+    _SUMMARY_PARTS = {
+        name: tuple(template.split("{text}"))
+        for name, template in _SUMMARY_TEMPLATES.items()
+    }
+    _MAP_PARTS = {
+        name: tuple(template.split("{text}"))
+        for name, template in _MAP_TEMPLATES.items()
+    }
+    _REDUCE_PARTS = {
+        name: tuple(template.split("{summaries}"))
+        for name, template in _REDUCE_TEMPLATES.items()
+    }
+
+    def __init__(self):
+        self.settings = get_settings()
+        # Extra kwargs flow through to the underlying httpx.AsyncClient.
+        # Size the keep-alive pool to the map-phase concurrency so chunk
+        # requests reuse warm connections instead of re-handshaking.
+        self.client = AsyncClient(
+            host=self.settings.ollama_base_url,
+            timeout=self.settings.request_timeout,
+            limits=httpx.Limits(
+                max_connections=self.settings.max_workers * 2,
+                max_keepalive_connections=self.settings.max_workers,
+            ),
+        )
+        # Hoist per-call settings out of the pydantic model; plain slots
+        # are cheaper than model attribute access in the map-phase loop
+        self._model = self.settings.ollama_model
+        self._max_workers = self.settings.max_workers
+        self._options = {"temperature": 0.1, "num_predict": 2048}
+        
+    async def summarize_transcript(
+        self, 
+        text: str, 
+        summary_type: str = "comprehensive",
+        on_token=None
+    ) -> SummarizationResult:
+        """
+        Summarize a transcript using map-reduce strategy for long texts.
         
-        template = templates.get(summary_type, templates["comprehensive"])
-        return PromptTemplate(template=template, input_variables=["summaries"])
+        Args:
+            text: The transcript text to summarize
+            summary_type: Type of summary (comprehensive, brief, key_points)
+            on_token: Optional callback receiving final-summary tokens as
+                they are generated, for incremental display
+            
+        Returns:
+            SummarizationResult with the summary and metadata
+        """
+        if not text or not text.strip():
+            # Zero chunks would fall into the map-reduce branch and fire
+            # a real LLM call on an empty prompt
+            raise ValueError("Cannot summarize empty or whitespace-only text")
+
+        logger.info("Starting transcript summarization",
+                   text_length=len(text), summary_type=summary_type)
+
+        try:
+            # Split text into chunks
+            chunks = self._split_text(text)
+            summary = await self._summarize_chunks(chunks, summary_type, on_token)
+            
+            result = SummarizationResult(
+                summary=summary,
+                original_length=len(text),
+                summary_length=len(summary),
+                compression_ratio=len(text) / len(summary) if summary else 0,
+                chunk_count=len(chunks),
+                summary_type=summary_type
+            )
+            
+            logger.info("Summarization completed", 
+                       chunk_count=len(chunks),
+                       compression_ratio=result.compression_ratio)
+            
+            return result
+            
+        except Exception as e:
+            logger.error("Summarization failed", error=str(e))
+            raise
+
+    def _token_split(self, text: str) -> List[str]:
+        """Split text into chunks sized by token count.
+
+        Character sizing undershoots the model context by roughly 4x
+        (one token ~ four characters), producing far more chunks — and
+        LLM round-trips — than necessary. Tokenize once with tiktoken
+        and slice fixed token windows with proportional overlap.
+        cl100k_base is not llama3's exact vocabulary but is close enough
+        for sizing.
+        """
+        import tiktoken
+
+        encoding = tiktoken.get_encoding("cl100k_base")
+        tokens = encoding.encode(text)
+        size = self.settings.chunk_size_tokens
+        # Scale the character overlap setting to tokens
+        overlap = max(self.settings.chunk_overlap // 4, 0)
+
+        if len(tokens) <= size:
+            return [text]
+
+        chunks = []
+        start = 0
+        while start < len(tokens):
+            window = tokens[start:start + size]
+            chunks.append(encoding.decode(window).strip())
+            if start + size >= len(tokens):
+                break
+            start += size - overlap
+
+        return [chunk for chunk in chunks if chunk]
+
+    def _split_text(self, text: str) -> List[str]:
+        """Split text into chunks using the configured strategy."""
+        if self.settings.token_chunking:
+            try:
+                return self._token_split(text)
+            except Exception as e:
+                logger.warning("Token chunking failed, falling back to characters",
+                               error=str(e))
+        return self._fast_split(text)
+
+    def _fast_split(self, text: str) -> List[str]:
+        """Split text into chunks of ~chunk_size with chunk_overlap.
+
+        Single left-to-right scan that prefers paragraph, line, sentence
+        and word boundaries via str.rfind, instead of the recursive
+        re-splitting RecursiveCharacterTextSplitter does over the whole
+        text for each separator.
+        """
+        size = self.settings.chunk_size
+        overlap = self.settings.chunk_overlap
+        chunks = []
+        start = 0
+        length = len(text)
+
+        while start < length:
+            end = start + size
+            if end >= length:
+                chunks.append(text[start:].strip())
+                break
+
+            # Only accept boundaries in the back half of the window so a
+            # dense run of separators can't produce tiny chunks
+            floor = start + size // 2
+            for separator in ("\n\n", "\n", ". ", " "):
+                cut = text.rfind(separator, floor, end)
+                if cut != -1:
+                    end = cut + len(separator)
+                    break
+
+            chunks.append(text[start:end].strip())
+            next_start = end - overlap
+            start = next_start if next_start > start else end
+
+        return [chunk for chunk in chunks if chunk]
+
+    async def _generate(self, prompt: str, on_token=None) -> str:
+        """Run one generation request against Ollama.
+
+        With an on_token callback the request is streamed and each token is
+        forwarded as it arrives, instead of blocking until the full
+        completion is ready.
+        """
+        if on_token is None:
+            response = await self.client.generate(
+                model=self._model,
+                prompt=prompt,
+                options=self._options,
+            )
+            return response["response"].strip()
+
+        parts = []
+        stream = await self.client.generate(
+            model=self._model,
+            prompt=prompt,
+            options=self._options,
+            stream=True,
+        )
+        async for part in stream:
+            token = part["response"]
+            parts.append(token)
+            on_token(token)
+        return "".join(parts).strip()
+
+    async def _summarize_chunks(self, chunks: List[str], summary_type: str, on_token=None) -> str:
+        """Summarize chunks, map-reducing only when there is more than one.
+
+        A lone chunk goes straight through the direct summary prompt —
+        running it through map plus reduce would spend an extra LLM call
+        for the same answer.
+        """
+        if len(chunks) == 1:
+            prefix, suffix = self._SUMMARY_PARTS.get(
+                summary_type, self._SUMMARY_PARTS["comprehensive"]
+            )
+            return await self._generate(prefix + chunks[0] + suffix, on_token)
+
+        # Map - summarize all chunks concurrently. The semaphore bounds
+        # in-flight requests to max_workers; there is no reason to wait
+        # for the slowest chunk of a batch before dispatching more.
+        map_prefix, map_suffix = self._MAP_PARTS.get(
+            summary_type, self._MAP_PARTS["comprehensive"]
+        )
+        semaphore = asyncio.Semaphore(self._max_workers)
+
+        async def _summarize_chunk(chunk: str) -> str:
+            async with semaphore:
+                return await self._generate(map_prefix + chunk + map_suffix)
+
+        chunk_summaries = await asyncio.gather(
+            *[_summarize_chunk(chunk) for chunk in chunks]
+        )
+
+        # Reduce - combine all chunk summaries
+        reduce_prefix, reduce_suffix = self._REDUCE_PARTS.get(
+            summary_type, self._REDUCE_PARTS["comprehensive"]
+        )
+        combined = "\n\n".join(chunk_summaries)
+
+        # Stream the reduce step if requested — it is the longest single
+        # generation and the part worth showing incrementally
+        return await self._generate(reduce_prefix + combined + reduce_suffix, on_token)
+
+    def _get_summary_prompt(self, summary_type: str) -> PromptTemplate:
+        """Get prompt template for single chunk summarization."""
+        return self._SUMMARY_PROMPTS.get(summary_type, self._SUMMARY_PROMPTS["comprehensive"])
+
+    def _get_map_prompt(self, summary_type: str) -> PromptTemplate:
+        """Get prompt template for map phase (chunk summarization)."""
+        return self._MAP_PROMPTS.get(summary_type, self._MAP_PROMPTS["comprehensive"])
+
+    def _get_reduce_prompt(self, summary_type: str) -> PromptTemplate:
+        """Get prompt template for reduce phase (combining summaries)."""
+        return self._REDUCE_PROMPTS.get(summary_type, self._REDUCE_PROMPTS["comprehensive"])
+
+
+# Global summarizer instance
+_summarizer_instance: Optional[TranscriptSummarizer] = None
 
 
 async def create_summarizer() -> TranscriptSummarizer:
-    """Factory function to create a summarizer instance."""
-    return TranscriptSummarizer()
+    """Get or create the shared summarizer instance.
+
+    Reusing one instance keeps the Ollama HTTP client (and its keep-alive
+    connections) warm across requests instead of rebuilding per task.
+    """
+    global _summarizer_instance
+    if _summarizer_instance is None:
+        _summarizer_instance = TranscriptSummarizer()
+    return _summarizer_instance
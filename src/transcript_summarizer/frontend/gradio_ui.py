@@ -2,20 +2,47 @@
 
 import gradio as gr
 import asyncio
+import hashlib
 import httpx
-import json
+import orjson
+import mmap
+import random
 import time
+from functools import lru_cache
 from typing import Optional, Tuple, Any
 import os
+from collections import OrderedDict
 from pathlib import Path
 import tempfile
 
 from ..utils.vtt_parser import VTTParser, is_valid_vtt
-from ..config.settings import Settings
+from ..config.settings import get_settings
+
+
+# VTTParser is stateless and its cleaning regexes are compiled at class
+# level, so one shared instance serves every UI (and reload) cheaply
+_VTT_PARSER = VTTParser()
+
+
+@lru_cache(maxsize=8)
+def _parse_vtt_cached(file_path: str, mtime: float, size: int):
+    """Parse a VTT file once per (path, mtime, size).
+
+    Re-uploads of the same file (examples, retries) skip the parse
+    entirely; the mtime/size key invalidates the entry if the file
+    changes on disk.
+    """
+    return _VTT_PARSER.parse_with_metadata(file_path)
 
 
 class TranscriptSummarizerUI:
     """Gradio web interface for transcript summarization."""
+
+    # Upper bound on simultaneous in-flight status polls
+    _MAX_CONCURRENT_POLLS = 8
+
+    # Entries kept in the per-process result cache
+    _RESULT_CACHE_SIZE = 32
     
     def __init__(self, api_base_url: str = None):
         """
@@ -24,9 +51,33 @@ class TranscriptSummarizerUI:
         Args:
             api_base_url: Base URL for the API (default: http://localhost:8000)
         """
-        self.settings = Settings()
+        self.settings = get_settings()
         self.api_base_url = api_base_url or "http://localhost:8000"
-        self.vtt_parser = VTTParser()
+        self.vtt_parser = _VTT_PARSER
+        # One pooled client for all API traffic. Per-call clients pay a
+        # TCP handshake for every submit and every poll; keep-alive
+        # connections make the poll loop essentially free on the wire.
+        self._client = httpx.AsyncClient(
+            base_url=self.api_base_url,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
+        # (path, stripped text) of the most recent upload, so an unedited
+        # uploaded transcript can be re-streamed from disk as multipart
+        # instead of being embedded in a JSON string
+        self._last_upload: Optional[Tuple[str, str]] = None
+        # Bound concurrent status requests across all sessions so a burst
+        # of waiting tabs can't stampede the API; the connection limits
+        # above are sized to this bound plus submit/health headroom
+        self._poll_sem = asyncio.Semaphore(self._MAX_CONCURRENT_POLLS)
+        # LRU of recent results: resubmitting the same transcript (e.g.
+        # while iterating on a prompt, or re-running an example) returns
+        # instantly instead of re-running the model for minutes
+        self._result_cache: OrderedDict = OrderedDict()
+
+    async def aclose(self):
+        """Close the pooled HTTP client."""
+        await self._client.aclose()
         
     def process_file_upload(self, file) -> Tuple[str, str]:
         """
@@ -39,6 +90,7 @@ class TranscriptSummarizerUI:
             Tuple of (processed_text, status_message)
         """
         if file is None:
+            self._last_upload = None
             return "", "❌ No file uploaded"
         
         try:
@@ -47,34 +99,50 @@ class TranscriptSummarizerUI:
             file_ext = Path(file_path).suffix.lower()
             
             if file_ext == '.vtt':
-                # Parse VTT file
-                transcript = self.vtt_parser.parse_vtt_file(file_path)
-                metadata = self.vtt_parser.extract_metadata(file_path)
+                # Parse VTT file: one pass yields both transcript and
+                # metadata, cached against repeat uploads
+                stat = os.stat(file_path)
+                transcript, metadata = _parse_vtt_cached(
+                    file_path, stat.st_mtime, stat.st_size
+                )
                 
-                status = f"✅ VTT file processed successfully!\n"
-                status += f"📊 Captions: {metadata.get('total_captions', 'Unknown')}\n"
-                status += f"⏱️ Duration: {metadata.get('duration', 'Unknown')}\n"
-                status += f"📝 Text length: {len(transcript)} characters"
+                status = (
+                    f"✅ VTT file processed successfully!\n"
+                    f"📊 Captions: {metadata.get('total_captions', 'Unknown')}\n"
+                    f"⏱️ Duration: {metadata.get('duration', 'Unknown')}\n"
+                    f"📝 Text length: {len(transcript)} characters"
+                )
                 
+                self._last_upload = (file_path, transcript.strip())
                 return transcript, status
                 
             elif file_ext in ['.txt', '.text']:
-                # Read plain text file
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    transcript = f.read()
+                # Read plain text via mmap: decode straight from the page
+                # cache instead of copying through a Python buffer first
+                with open(file_path, 'rb') as f:
+                    size = os.fstat(f.fileno()).st_size
+                    if size == 0:
+                        transcript = ""
+                    else:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            transcript = mm[:].decode('utf-8')
                 
-                status = f"✅ Text file processed successfully!\n"
-                status += f"📝 Text length: {len(transcript)} characters"
+                status = (
+                    f"✅ Text file processed successfully!\n"
+                    f"📝 Text length: {len(transcript)} characters"
+                )
                 
+                self._last_upload = (file_path, transcript.strip())
                 return transcript, status
                 
             else:
                 return "", f"❌ Unsupported file type: {file_ext}. Please upload .vtt or .txt files."
                 
         except Exception as e:
+            self._last_upload = None
             return "", f"❌ Error processing file: {str(e)}"
     
-    def validate_transcript_input(self, text: str) -> Tuple[bool, str]:
+    def validate_transcript_input(self, text: str) -> Tuple[bool, str, str]:
         """
         Validate transcript input.
         
@@ -82,19 +150,95 @@ class TranscriptSummarizerUI:
             text: Input text
             
         Returns:
-            Tuple of (is_valid, status_message)
+            Tuple of (is_valid, status_message, stripped_text)
         """
-        if not text or not text.strip():
-            return False, "❌ Please provide transcript text or upload a file"
-        
-        if len(text.strip()) < 50:
-            return False, "❌ Transcript too short (minimum 50 characters)"
+        # Order the checks so the 1MB upper bound and the blank test run
+        # before any copy is made; the single strip below is reused by the
+        # caller instead of being repeated per use
+        if not text or text.isspace():
+            return False, "❌ Please provide transcript text or upload a file", ""
         
         if len(text) > 1000000:  # 1MB limit
-            return False, "❌ Transcript too long (maximum 1MB)"
+            return False, "❌ Transcript too long (maximum 1MB)", ""
         
-        return True, "✅ Transcript validation passed"
+        stripped = text.strip()
+        if len(stripped) < 50:
+            return False, "❌ Transcript too short (minimum 50 characters)", ""
+        
+        return True, "✅ Transcript validation passed", stripped
     
+    async def _fetch_summary(
+        self, task_id: str, elapsed: float,
+        summary_response: Optional[httpx.Response] = None
+    ) -> Tuple[str, str, str]:
+        """Retrieve a finished summary and build the status message.
+
+        A speculatively prefetched response can be passed in; it is used
+        when it succeeded and re-fetched otherwise.
+        """
+        if summary_response is None or summary_response.status_code != 200:
+            summary_response = await self._client.get(f"/summary/{task_id}")
+
+        if summary_response.status_code != 200:
+            return "", f"❌ Failed to retrieve summary: {summary_response.status_code}", task_id
+
+        summary = orjson.loads(summary_response.content).get("summary", "")
+        final_status = (
+            f"✅ Summarization completed!\n"
+            f"📝 Summary length: {len(summary)} characters\n"
+            f"⏱️ Processing time: {int(elapsed)} seconds"
+        )
+        return summary, final_status, task_id
+
+    async def _submit_request(self, transcript_text: str, summary_type: str,
+                              custom_prompt: str) -> httpx.Response:
+        """Submit a summarization request, streaming uploads when possible.
+
+        If the transcript is an unedited file upload, re-stream the file
+        from disk as multipart/form-data: httpx sends it chunked, so the
+        text is never copied into (and escaped inside) a JSON string.
+        """
+        upload = self._last_upload
+        if upload is not None and upload[1] == transcript_text:
+            file_path, _ = upload
+            data = {"summary_type": summary_type}
+            if custom_prompt:
+                data["custom_prompt"] = custom_prompt
+            mime = "text/vtt" if file_path.endswith('.vtt') else "text/plain"
+            try:
+                with open(file_path, 'rb') as f:
+                    return await self._client.post(
+                        "/summarize/upload",
+                        files={"file": (Path(file_path).name, f, mime)},
+                        data=data,
+                    )
+            except OSError:
+                pass  # Gradio may have reaped its temp file; fall back
+
+        request_data = {
+            "text": transcript_text,
+            "summary_type": summary_type
+        }
+        if custom_prompt:
+            request_data["custom_prompt"] = custom_prompt
+
+        # Pre-encode with orjson; httpx's json= path uses stdlib json
+        return await self._client.post(
+            "/summarize",
+            content=orjson.dumps(request_data),
+            headers={"Content-Type": "application/json"},
+        )
+
+    def _cache_result(self, cache_key, result: Tuple[str, str, str]) -> Tuple[str, str, str]:
+        """Record a successful summary in the LRU result cache."""
+        summary, _, task_id = result
+        if summary:
+            self._result_cache[cache_key] = (summary, task_id)
+            self._result_cache.move_to_end(cache_key)
+            if len(self._result_cache) > self._RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return result
+
     async def summarize_transcript(
         self, 
         transcript: str, 
@@ -113,102 +257,162 @@ class TranscriptSummarizerUI:
             Tuple of (summary, status, task_id)
         """
         try:
-            # Validate input
-            is_valid, validation_msg = self.validate_transcript_input(transcript)
+            # Validate input; reuse the stripped text it already produced
+            is_valid, validation_msg, transcript_text = self.validate_transcript_input(transcript)
             if not is_valid:
                 return "", validation_msg, ""
             
-            # Prepare request
-            request_data = {
-                "text": transcript.strip(),
-                "summary_type": summary_type
-            }
-            
-            if custom_prompt.strip():
-                request_data["custom_prompt"] = custom_prompt.strip()
-            
-            # Submit summarization request
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.api_base_url}/summarize",
-                    json=request_data
-                )
-                
-                if response.status_code != 200:
-                    error_msg = f"❌ API Error: {response.status_code}"
+            # blake2b is the fastest stdlib hash; 16 bytes is plenty to
+            # key a 32-entry cache
+            cache_key = (
+                hashlib.blake2b(transcript_text.encode(), digest_size=16).digest(),
+                summary_type,
+                custom_prompt.strip(),
+            )
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                summary, task_id = cached
+                return summary, "✅ Summary served from cache", task_id
+
+            response = await self._submit_request(
+                transcript_text, summary_type, custom_prompt.strip()
+            )
+
+            if response.status_code != 200:
+                # Only attempt to decode bodies the server declared as
+                # JSON; a bare except here would also swallow real bugs
+                content_type = response.headers.get("content-type", "")
+                error_msg = f"❌ API Error: {response.status_code}"
+                if content_type.startswith("application/json"):
                     try:
-                        error_detail = response.json().get("detail", "Unknown error")
-                        error_msg += f" - {error_detail}"
-                    except:
+                        error_detail = orjson.loads(response.content).get("detail", "Unknown error")
+                        error_msg = f"❌ API Error: {response.status_code} - {error_detail}"
+                    except orjson.JSONDecodeError:
                         pass
-                    return "", error_msg, ""
-                
-                result = response.json()
-                task_id = result.get("task_id")
-                
-                if not task_id:
-                    return "", "❌ No task ID returned from API", ""
-                
-                # Poll for completion
-                status_msg = f"🔄 Summarization started (Task ID: {task_id})"
-                
-                max_attempts = 60  # 5 minutes maximum
-                attempt = 0
-                
-                while attempt < max_attempts:
-                    await asyncio.sleep(5)  # Wait 5 seconds between checks
-                    attempt += 1
-                    
-                    try:
-                        status_response = await client.get(
-                            f"{self.api_base_url}/status/{task_id}"
-                        )
-                        
-                        if status_response.status_code == 200:
-                            status_data = status_response.json()
-                            task_status = status_data.get("status")
-                            
-                            if task_status == "completed":
-                                # Get the summary
-                                summary_response = await client.get(
-                                    f"{self.api_base_url}/summary/{task_id}"
+                return "", error_msg, ""
+
+            result = orjson.loads(response.content)
+            task_id = result.get("task_id")
+
+            if not task_id:
+                return "", "❌ No task ID returned from API", ""
+
+            # Wait for completion
+            status_msg = f"🔄 Summarization started (Task ID: {task_id})"
+            started = time.monotonic()
+            timeout_seconds = 300.0  # 5 minutes maximum
+
+            # Prefer the push-based status stream: completion arrives as
+            # soon as the backend publishes it, instead of up to one poll
+            # interval later, and idle waits cost no round-trips
+            try:
+                async with self._client.stream(
+                    "GET",
+                    f"/status/{task_id}/stream",
+                    headers={"Accept": "text/event-stream"},
+                    timeout=httpx.Timeout(30.0, read=timeout_seconds),
+                ) as events:
+                    async for line in events.aiter_lines():
+                        if time.monotonic() - started > timeout_seconds:
+                            break
+
+                        if not line.startswith("data:"):
+                            continue  # comments and heartbeats
+
+                        event = orjson.loads(line[len("data:"):].strip())
+                        state = event.get("status")
+
+                        if state == "SUCCESS":
+                            return self._cache_result(
+                                cache_key,
+                                await self._fetch_summary(
+                                    task_id, time.monotonic() - started
+                                ),
+                            )
+                        if state == "FAILURE":
+                            return "", "❌ Summarization failed", task_id
+            except Exception:
+                pass  # Stream unavailable; fall back to short polling
+
+            # Fallback: poll with exponential backoff. Short jobs get
+            # sub-second completion checks instead of a fixed 5s slack,
+            # long jobs issue far fewer requests
+            estimated = result.get("estimated_completion_time")
+            delay = max(0.25, estimated / 10) if estimated else 0.25
+            attempt = 0
+            speculative = None  # early summary fetch, started near completion
+
+            while time.monotonic() - started < timeout_seconds:
+                await asyncio.sleep(delay + random.uniform(0, 0.2))
+                delay = min(delay * 1.7, 5.0)
+                attempt += 1
+
+                try:
+                    async with self._poll_sem:
+                        status_response = await self._client.get(f"/status/{task_id}")
+
+                    if status_response.status_code in (429, 503):
+                        retry_after = status_response.headers.get("retry-after")
+                        if retry_after and retry_after.isdigit():
+                            delay = min(float(retry_after), 30.0)
+                        continue
+
+                    if status_response.status_code == 200:
+                        status_data = orjson.loads(status_response.content)
+                        task_status = status_data.get("status")
+
+                        if task_status == "completed":
+                            prefetched = None
+                            if speculative is not None:
+                                try:
+                                    prefetched = await speculative
+                                except Exception:
+                                    prefetched = None
+                            return self._cache_result(
+                                cache_key,
+                                await self._fetch_summary(
+                                    task_id, time.monotonic() - started,
+                                    prefetched,
+                                ),
+                            )
+
+                        elif task_status == "failed":
+                            if speculative is not None:
+                                speculative.cancel()
+                            error_msg = status_data.get("error", "Unknown error")
+                            return "", f"❌ Summarization failed: {error_msg}", task_id
+
+                        elif task_status in ["pending", "processing"]:
+                            # Near the end, start fetching the summary in
+                            # the background so the final transition costs
+                            # zero extra round-trips when it lands
+                            progress = status_data.get("progress") or 0
+                            if (speculative is None
+                                    and task_status == "processing"
+                                    and progress >= 90):
+                                speculative = asyncio.create_task(
+                                    self._client.get(f"/summary/{task_id}")
                                 )
-                                
-                                if summary_response.status_code == 200:
-                                    summary_data = summary_response.json()
-                                    summary = summary_data.get("summary", "")
-                                    
-                                    final_status = f"✅ Summarization completed!\n"
-                                    final_status += f"📝 Summary length: {len(summary)} characters\n"
-                                    final_status += f"⏱️ Processing time: {attempt * 5} seconds"
-                                    
-                                    return summary, final_status, task_id
-                                else:
-                                    return "", f"❌ Failed to retrieve summary: {summary_response.status_code}", task_id
-                            
-                            elif task_status == "failed":
-                                error_msg = status_data.get("error", "Unknown error")
-                                return "", f"❌ Summarization failed: {error_msg}", task_id
-                            
-                            elif task_status in ["pending", "processing"]:
-                                status_msg = f"🔄 Processing... (attempt {attempt}/{max_attempts})"
-                                continue
-                        
-                    except Exception as e:
-                        continue  # Continue polling on temporary errors
-                
-                return "", f"⏰ Summarization timed out after {max_attempts * 5} seconds", task_id
+                            status_msg = f"🔄 Processing... (attempt {attempt})"
+                            continue
+
+                except Exception as e:
+                    continue  # Continue polling on temporary errors
+
+            if speculative is not None:
+                speculative.cancel()
+            return "", f"⏰ Summarization timed out after {int(timeout_seconds)} seconds", task_id
                 
         except Exception as e:
             return "", f"❌ Error: {str(e)}", ""
     
-    def check_api_health(self) -> str:
+    async def check_api_health(self) -> str:
         """Check if the API is healthy."""
         try:
-            import requests
-            response = requests.get(f"{self.api_base_url}/health", timeout=5)
+            response = await self._client.get("/health", timeout=5.0)
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 if data.get("status") == "healthy":
                     return "✅ API is healthy and ready"
                 else:
@@ -253,7 +457,7 @@ class TranscriptSummarizerUI:
             with gr.Row():
                 health_status = gr.Textbox(
                     label="🔍 API Status",
-                    value=self.check_api_health(),
+                    value="🔄 Checking API status...",
                     interactive=False,
                     elem_classes=["status-box"]
                 )
@@ -329,6 +533,12 @@ class TranscriptSummarizerUI:
             
             # Examples section
             gr.Markdown("## 💡 Examples")
+
+            async def examples_fn(transcript, summary_type, custom_prompt):
+                summary, status, _ = await self.summarize_transcript(
+                    transcript, summary_type, custom_prompt
+                )
+                return summary, status  # Only return summary and status
             
             examples = gr.Examples(
                 examples=[
@@ -338,8 +548,11 @@ class TranscriptSummarizerUI:
                 ],
                 inputs=[transcript_input, summary_type, custom_prompt],
                 outputs=[summary_output, process_status],
-                fn=lambda x, y, z: asyncio.run(self.summarize_transcript(x, y, z))[:2],  # Only return summary and status
-                cache_examples=False
+                fn=examples_fn,
+                # Lazy caching runs each example once on first click and
+                # serves the stored output afterwards; eager caching would
+                # require a live API during UI construction
+                cache_examples="lazy"
             )
             
             # Event handlers
@@ -349,25 +562,17 @@ class TranscriptSummarizerUI:
                 text, status = self.process_file_upload(file)
                 return text, status
             
-            def handle_summarize(transcript, summary_type, custom_prompt):
+            # Gradio awaits coroutines on its own event loop, so no
+            # per-click loop construction — and the shared httpx client can
+            # actually pool connections across requests
+            async def handle_summarize(transcript, summary_type, custom_prompt):
                 try:
-                    # Run async function
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    result = loop.run_until_complete(
-                        self.summarize_transcript(transcript, summary_type, custom_prompt)
+                    return await self.summarize_transcript(
+                        transcript, summary_type, custom_prompt
                     )
-                    loop.close()
-                    return result
                 except Exception as e:
                     return "", f"❌ Error: {str(e)}", ""
             
-            def handle_clear():
-                return "", "", "", "", "", ""
-            
-            def handle_refresh_health():
-                return self.check_api_health()
-            
             # Wire up events
             file_upload.change(
                 fn=handle_file_upload,
@@ -381,13 +586,24 @@ class TranscriptSummarizerUI:
                 outputs=[summary_output, process_status, task_id_output]
             )
             
+            # Clearing is pure UI state; resetting the fields client-side
+            # skips a server round-trip and a queue slot entirely
             clear_btn.click(
-                fn=handle_clear,
-                outputs=[transcript_input, file_status, summary_output, process_status, task_id_output, custom_prompt]
+                fn=None,
+                outputs=[transcript_input, file_status, summary_output, process_status, task_id_output, custom_prompt],
+                js="() => ['', '', '', '', '', '']"
             )
             
+            # Gradio awaits async handlers directly on its event loop, so
+            # the health probe shares the pooled client with the rest of
+            # the UI instead of blocking a worker thread
             refresh_health.click(
-                fn=handle_refresh_health,
+                fn=self.check_api_health,
+                outputs=[health_status]
+            )
+
+            demo.load(
+                fn=self.check_api_health,
                 outputs=[health_status]
             )
         
@@ -396,7 +612,10 @@ class TranscriptSummarizerUI:
     def launch(self, **kwargs):
         """Launch the Gradio interface."""
         demo = self.create_interface()
-        return demo.launch(**kwargs)
+        try:
+            return demo.launch(**kwargs)
+        finally:
+            asyncio.run(self.aclose())
 
 
 def create_ui(api_base_url: str = None) -> TranscriptSummarizerUI:
@@ -1,19 +1,23 @@
 """Pydantic models for API requests and responses."""
 
-from datetime import datetime
-from enum import Enum
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from datetime import datetime, timezone
+from enum import StrEnum
+from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, Field, field_validator
 
 
-class SummaryType(str, Enum):
+def _utcnow() -> datetime:
+    """Timezone-aware UTC timestamp; the naive utcnow is deprecated."""
+    return datetime.now(timezone.utc)
+
+class SummaryType(StrEnum):
     """Types of summaries that can be generated."""
     COMPREHENSIVE = "comprehensive"
     BRIEF = "brief"
     KEY_POINTS = "key_points"
 
 
-class TaskStatus(str, Enum):
+class TaskStatus(StrEnum):
     """Status of a summarization task."""
     PENDING = "pending"
     PROCESSING = "processing"
@@ -24,10 +28,12 @@ class TaskStatus(str, Enum):
 class SummarizationRequest(BaseModel):
     """Request model for transcript summarization."""
     
+    # No max_length here: the upper bound is settings.max_text_length,
+    # enforced by the endpoint with a 413 — a schema bound would reject
+    # oversized text first with a 422 and shadow that path
     text: str = Field(
         ...,
         min_length=10,
-        max_length=1000000,
         description="The transcript text to summarize"
     )
     
@@ -41,11 +47,16 @@ class SummarizationRequest(BaseModel):
         description="Optional metadata about the transcript"
     )
 
-    @validator('text')
+    @field_validator('text', mode='before')
+    @classmethod
     def validate_text(cls, v):
-        if not v.strip():
-            raise ValueError("Text cannot be empty or only whitespace")
-        return v.strip()
+        # Strip before the length constraints run so a near-max input is
+        # not materialized twice (field copy plus stripped copy)
+        if isinstance(v, str):
+            v = v.strip()
+            if not v:
+                raise ValueError("Text cannot be empty or only whitespace")
+        return v
 
 
 class SummarizationResponse(BaseModel):
@@ -70,7 +81,7 @@ class SummarizationResult(BaseModel):
     chunk_count: int = Field(..., description="Number of chunks processed")
     summary_type: str = Field(..., description="Type of summary generated")
     processing_time: Optional[float] = Field(None, description="Processing time in seconds")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
 
 
 class TaskStatusResponse(BaseModel):
@@ -81,15 +92,26 @@ class TaskStatusResponse(BaseModel):
     progress: Optional[float] = Field(None, description="Progress percentage (0-100)")
     result: Optional[SummarizationResult] = Field(None, description="Result if completed")
     error_message: Optional[str] = Field(None, description="Error message if failed")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
+
+
+class TaskStatusBatchRequest(BaseModel):
+    """Request model for batched task status lookups."""
+
+    task_ids: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Task identifiers to look up"
+    )
 
 
 class HealthResponse(BaseModel):
     """Health check response model."""
     
     status: str = Field(..., description="Health status")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
     version: str = Field(..., description="Application version")
     services: Dict[str, str] = Field(..., description="Service status")
 
@@ -100,4 +122,4 @@ class ErrorResponse(BaseModel):
     error: str = Field(..., description="Error type")
     message: str = Field(..., description="Error message")
     details: Optional[Dict[str, Any]] = Field(None, description="Additional error details")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
@@ -1,7 +1,12 @@
 """Vector storage using ChromaDB for transcript and summary storage."""
 
+import asyncio
+import hashlib
+import time
 import uuid
+from collections import Counter, OrderedDict
 from typing import List, Optional, Dict, Any
+import numpy as np
 import structlog
 import chromadb
 from chromadb.config import Settings as ChromaSettings
@@ -13,41 +18,206 @@ from ..models.schemas import SummarizationResult
 logger = structlog.get_logger(__name__)
 
 
+def _utcnow_iso() -> str:
+    """ISO timestamp for documents stored before their result exists."""
+    from datetime import datetime, timezone
+    return datetime.now(timezone.utc).isoformat()
+
+
+class _AsyncCollectionAdapter:
+    """Awaitable facade over a synchronous local Chroma collection.
+
+    Embedded (PersistentClient) collections are synchronous; running
+    their SQLite work in a thread keeps VectorStore's interface
+    uniformly async regardless of the configured mode.
+    """
+
+    def __init__(self, collection):
+        self._collection = collection
+
+    def __getattr__(self, name):
+        method = getattr(self._collection, name)
+
+        async def _call(*args, **kwargs):
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+        return _call
+
+
 class VectorStore:
     """ChromaDB-based vector store for transcripts and summaries."""
 
+    # Entries kept in the query-embedding cache
+    _EMB_CACHE_SIZE = 1024
+
+    # Semantic result cache: entries per (summary_type, limit) namespace,
+    # minimum cosine similarity for a hit, and entry lifetime in seconds
+    _RESULT_CACHE_SIZE = 64
+    _RESULT_CACHE_TAU = 0.95
+    _RESULT_CACHE_TTL = 300.0
+
+    # Slotted layout: attribute access on the hot store/search paths is
+    # an array index instead of a dict lookup
+    __slots__ = (
+        "settings", "client", "collection",
+        "_collection_name", "_chroma_host", "_chroma_port",
+        "_embedding_fn", "_emb_cache", "_result_cache",
+        "_stats", "_summary_types", "_task_types",
+    )
+
     def __init__(self):
         self.settings = get_settings()
         self.client = None
         self.collection = None
-        self._initialize_client()
+        # Hoist per-call settings out of the pydantic model; health and
+        # store/search calls then skip its descriptor machinery
+        self._collection_name = self.settings.chroma_collection_name
+        self._chroma_host = self.settings.chroma_host
+        self._chroma_port = self.settings.chroma_port
+        # Query embedding cache: the embedding forward pass dominates
+        # query latency, and repeated searches are common. Embeddings are
+        # deterministic, so plain LRU eviction is enough — no TTL needed.
+        # The embedder is built lazily; False marks it as unavailable.
+        self._embedding_fn = None
+        self._emb_cache: OrderedDict = OrderedDict()
+        # Semantic result cache: near-duplicate queries (cosine >= tau
+        # against a cached query embedding) reuse stored results instead
+        # of a Chroma round-trip. Keyed by the query parameters so a
+        # different filter or limit never aliases.
+        self._result_cache: Dict[Any, List[Any]] = {}
+        # Running document counters, maintained by store/delete. Stats
+        # reads then cost one count() round-trip instead of pulling a
+        # metadata sample over HTTP and tallying it client-side.
+        self._stats = {"summary_count": 0, "original_count": 0}
+        self._summary_types: Counter = Counter()
+        self._task_types: Dict[str, str] = {}
+
+    def _cached_results(
+        self, namespace, query_embedding: List[float]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Return cached results for a semantically equivalent query."""
+        entries = self._result_cache.get(namespace)
+        if not entries:
+            return None
+
+        now = time.monotonic()
+        q = np.asarray(query_embedding)
+        q_norm = np.linalg.norm(q)
+        if q_norm == 0:
+            return None
+
+        fresh = [e for e in entries if now - e[1] <= self._RESULT_CACHE_TTL]
+        self._result_cache[namespace] = fresh
+        for vector, _, results in fresh:
+            similarity = float(np.dot(vector, q) / q_norm)
+            if similarity >= self._RESULT_CACHE_TAU:
+                return results
+        return None
 
-    def _initialize_client(self):
-        """Initialize ChromaDB client and collection."""
+    def _store_results(
+        self, namespace, query_embedding: List[float],
+        results: List[Dict[str, Any]]
+    ) -> None:
+        """Record query results in the semantic cache."""
+        q = np.asarray(query_embedding)
+        q_norm = np.linalg.norm(q)
+        if q_norm == 0:
+            return
+        entries = self._result_cache.setdefault(namespace, [])
+        # Cached vectors are pre-normalized so lookups cost one dot product
+        entries.append((q / q_norm, time.monotonic(), results))
+        if len(entries) > self._RESULT_CACHE_SIZE:
+            entries.pop(0)
+
+    def _embed_texts(self, texts: List[str]) -> Optional[List[List[float]]]:
+        """Embed texts locally, or None when no embedder is available.
+
+        Callers fall back to letting Chroma embed server-side in the
+        None case.
+        """
+        if self._embedding_fn is False:
+            return None
         try:
+            if self._embedding_fn is None:
+                from chromadb.utils import embedding_functions
+                # Same default model Chroma applies to plain documents and
+                # query_texts, so results match the uncached path
+                self._embedding_fn = embedding_functions.DefaultEmbeddingFunction()
+            return self._embedding_fn(texts)
+        except Exception as e:
+            logger.warning("Local embedding unavailable, deferring to Chroma",
+                           error=str(e))
+            self._embedding_fn = False
+            return None
+
+    def _embed_query(self, query_text: str) -> Optional[List[float]]:
+        """Embed a query string, memoizing by content hash."""
+        key = hashlib.sha256(query_text.encode()).digest()
+        cached = self._emb_cache.get(key)
+        if cached is not None:
+            self._emb_cache.move_to_end(key)
+            return cached
+
+        vectors = self._embed_texts([query_text])
+        if vectors is None:
+            return None
+        vector = vectors[0]
+
+        if hasattr(vector, "tolist"):
+            vector = vector.tolist()
+        self._emb_cache[key] = vector
+        if len(self._emb_cache) > self._EMB_CACHE_SIZE:
+            self._emb_cache.popitem(last=False)
+        return vector
+
+    async def _initialize_client(self):
+        """Initialize the async ChromaDB client and collection.
+
+        The async client awaits its HTTP I/O instead of blocking the
+        event loop, so vector-store calls can overlap with summarizer
+        requests running on the same loop.
+        """
+        try:
+            if self.settings.chroma_mode == "persistent":
+                await self._initialize_persistent_client()
+                return
+
             # Configure ChromaDB client
             chroma_settings = ChromaSettings(
-                chroma_server_host=self.settings.chroma_host,
-                chroma_server_http_port=self.settings.chroma_port,
-                chroma_api_impl="rest",
+                chroma_server_host=self._chroma_host,
+                chroma_server_http_port=self._chroma_port,
+                # Size the client's persistent connection pool for burst
+                # worker load; keep-alive avoids a TCP handshake per call
+                # and the pool lives as long as the singleton instance
+                chroma_http_max_connections=64,
+                chroma_http_max_keepalive_connections=32,
+                chroma_http_keepalive_secs=30.0,
             )
             
-            self.client = chromadb.HttpClient(
-                host=self.settings.chroma_host,
-                port=self.settings.chroma_port,
+            self.client = await chromadb.AsyncHttpClient(
+                host=self._chroma_host,
+                port=self._chroma_port,
                 settings=chroma_settings
             )
             
             # Get or create collection
             try:
-                self.collection = self.client.get_collection(
-                    name=self.settings.chroma_collection_name
+                self.collection = await self.client.get_collection(
+                    name=self._collection_name
                 )
                 logger.info("Connected to existing ChromaDB collection")
             except Exception:
-                self.collection = self.client.create_collection(
-                    name=self.settings.chroma_collection_name,
-                    metadata={"description": "Transcript summaries and related documents"}
+                self.collection = await self.client.create_collection(
+                    name=self._collection_name,
+                    metadata={
+                        "description": "Transcript summaries and related documents",
+                        # Tune the backing HNSW graph for cosine similarity
+                        # search instead of the default L2 configuration
+                        "hnsw:space": self.settings.chroma_hnsw_space,
+                        "hnsw:M": self.settings.chroma_hnsw_m,
+                        "hnsw:construction_ef": self.settings.chroma_hnsw_construction_ef,
+                        "hnsw:search_ef": self.settings.chroma_hnsw_search_ef,
+                    }
                 )
                 logger.info("Created new ChromaDB collection")
                 
@@ -55,6 +225,65 @@ class VectorStore:
             logger.error("Failed to initialize ChromaDB", error=str(e))
             raise
 
+    async def _initialize_persistent_client(self):
+        """Initialize an embedded ChromaDB client.
+
+        For worker-local deployments this drops the HTTP+JSON round-trip
+        per operation; SQLite transaction cost remains either way.
+        """
+        self.client = chromadb.PersistentClient(
+            path=self.settings.chroma_persistent_path,
+            settings=ChromaSettings(anonymized_telemetry=False),
+        )
+
+        if self.settings.chroma_unsafe_fast:
+            self._apply_sqlite_pragmas()
+
+        try:
+            collection = self.client.get_collection(
+                name=self._collection_name
+            )
+            logger.info("Connected to existing ChromaDB collection")
+        except Exception:
+            collection = self.client.create_collection(
+                name=self._collection_name,
+                metadata={
+                    "description": "Transcript summaries and related documents",
+                    "hnsw:space": self.settings.chroma_hnsw_space,
+                    "hnsw:M": self.settings.chroma_hnsw_m,
+                    "hnsw:construction_ef": self.settings.chroma_hnsw_construction_ef,
+                    "hnsw:search_ef": self.settings.chroma_hnsw_search_ef,
+                }
+            )
+            logger.info("Created new ChromaDB collection")
+
+        self.collection = _AsyncCollectionAdapter(collection)
+
+    def _apply_sqlite_pragmas(self):
+        """Tune the embedded client's SQLite for write-heavy storage.
+
+        WAL avoids a journal rewrite per commit and stops writers from
+        blocking readers; NORMAL sync fsyncs only at checkpoint
+        boundaries (slightly weaker durability, hence the opt-in
+        setting). journal_mode sticks to the database file; the other
+        pragmas are per-connection best effort on the pooled handle.
+        """
+        try:
+            from chromadb.db.impl.sqlite import SqliteDB
+            conn = self.client._system.instance(SqliteDB)._conn_pool.connect()
+            for pragma in (
+                "journal_mode=WAL",
+                "synchronous=NORMAL",
+                "temp_store=memory",
+                "mmap_size=268435456",
+            ):
+                conn.execute(f"PRAGMA {pragma}")
+            logger.info("Applied write-optimized SQLite pragmas")
+        except Exception as e:
+            # Internals shifted between chromadb releases; the client
+            # still works with default pragmas
+            logger.warning("Could not apply SQLite pragmas", error=str(e))
+
     async def store_summary(
         self, 
         task_id: str, 
@@ -74,6 +303,8 @@ class VectorStore:
         """
         try:
             doc_id = f"summary_{task_id}"
+            original_doc_id = f"original_{task_id}"
+            created_at_iso = result.created_at.isoformat()
             
             metadata = {
                 "task_id": task_id,
@@ -82,36 +313,50 @@ class VectorStore:
                 "summary_length": result.summary_length,
                 "compression_ratio": result.compression_ratio,
                 "chunk_count": result.chunk_count,
-                "created_at": result.created_at.isoformat(),
+                "created_at": created_at_iso,
                 "document_type": "summary"
             }
             
             if result.processing_time:
                 metadata["processing_time"] = result.processing_time
             
-            # Store the summary with metadata
-            self.collection.add(
-                documents=[result.summary],
-                metadatas=[metadata],
-                ids=[doc_id]
-            )
-            
-            # Also store the original text for reference
-            original_doc_id = f"original_{task_id}"
             original_metadata = {
                 "task_id": task_id,
                 "document_type": "original",
                 "text_length": len(original_text),
-                "created_at": result.created_at.isoformat(),
+                "created_at": created_at_iso,
                 "related_summary_id": doc_id
             }
             
-            self.collection.add(
-                documents=[original_text],
-                metadatas=[original_metadata],
-                ids=[original_doc_id]
-            )
+            # Store summary and original in one batched add: each add is a
+            # full round-trip plus a server-side transaction, so one call
+            # halves the per-task insert overhead. Embeddings are computed
+            # locally when possible (compact float32, and the server skips
+            # its embedding pass); otherwise Chroma embeds as before.
+            documents = [result.summary, original_text]
+            embeddings = self._embed_texts(documents)
+            if embeddings is not None:
+                await self.collection.add(
+                    documents=documents,
+                    embeddings=np.ascontiguousarray(embeddings, dtype=np.float32),
+                    metadatas=[metadata, original_metadata],
+                    ids=[doc_id, original_doc_id]
+                )
+            else:
+                await self.collection.add(
+                    documents=documents,
+                    metadatas=[metadata, original_metadata],
+                    ids=[doc_id, original_doc_id]
+                )
             
+            # New documents can change any search's answer
+            self._result_cache.clear()
+
+            self._stats["summary_count"] += 1
+            self._stats["original_count"] += 1
+            self._summary_types[result.summary_type] += 1
+            self._task_types[task_id] = result.summary_type
+
             logger.info("Stored summary in vector database", 
                        task_id=task_id, doc_id=doc_id)
             
@@ -121,6 +366,104 @@ class VectorStore:
             logger.error("Failed to store summary", task_id=task_id, error=str(e))
             raise
 
+    async def store_original(self, task_id: str, original_text: str) -> str:
+        """Store just the original transcript for a task.
+
+        Split out of store_summary so the worker can start this write
+        while the summarization itself is still running.
+        """
+        try:
+            original_doc_id = f"original_{task_id}"
+            original_metadata = {
+                "task_id": task_id,
+                "document_type": "original",
+                "text_length": len(original_text),
+                "created_at": _utcnow_iso(),
+                "related_summary_id": f"summary_{task_id}"
+            }
+
+            documents = [original_text]
+            embeddings = self._embed_texts(documents)
+            if embeddings is not None:
+                await self.collection.add(
+                    documents=documents,
+                    embeddings=np.ascontiguousarray(embeddings, dtype=np.float32),
+                    metadatas=[original_metadata],
+                    ids=[original_doc_id]
+                )
+            else:
+                await self.collection.add(
+                    documents=documents,
+                    metadatas=[original_metadata],
+                    ids=[original_doc_id]
+                )
+
+            self._result_cache.clear()
+            self._stats["original_count"] += 1
+
+            return original_doc_id
+
+        except Exception as e:
+            logger.error("Failed to store original text", task_id=task_id,
+                         error=str(e))
+            raise
+
+    async def store_summary_doc(
+        self,
+        task_id: str,
+        result: SummarizationResult
+    ) -> str:
+        """Store just the summary document for a task.
+
+        Counterpart of store_original for the pipelined worker path.
+        """
+        try:
+            doc_id = f"summary_{task_id}"
+
+            metadata = {
+                "task_id": task_id,
+                "summary_type": result.summary_type,
+                "original_length": result.original_length,
+                "summary_length": result.summary_length,
+                "compression_ratio": result.compression_ratio,
+                "chunk_count": result.chunk_count,
+                "created_at": result.created_at.isoformat(),
+                "document_type": "summary"
+            }
+
+            if result.processing_time:
+                metadata["processing_time"] = result.processing_time
+
+            documents = [result.summary]
+            embeddings = self._embed_texts(documents)
+            if embeddings is not None:
+                await self.collection.add(
+                    documents=documents,
+                    embeddings=np.ascontiguousarray(embeddings, dtype=np.float32),
+                    metadatas=[metadata],
+                    ids=[doc_id]
+                )
+            else:
+                await self.collection.add(
+                    documents=documents,
+                    metadatas=[metadata],
+                    ids=[doc_id]
+                )
+
+            self._result_cache.clear()
+            self._stats["summary_count"] += 1
+            self._summary_types[result.summary_type] += 1
+            self._task_types[task_id] = result.summary_type
+
+            logger.info("Stored summary in vector database",
+                        task_id=task_id, doc_id=doc_id)
+
+            return doc_id
+
+        except Exception as e:
+            logger.error("Failed to store summary", task_id=task_id, error=str(e))
+            raise
+
     async def get_summary(self, task_id: str) -> Optional[SummarizationResult]:
         """
         Retrieve a summary by task ID.
@@ -134,7 +477,7 @@ class VectorStore:
         try:
             doc_id = f"summary_{task_id}"
             
-            results = self.collection.get(
+            results = await self.collection.get(
                 ids=[doc_id],
                 include=["documents", "metadatas"]
             )
@@ -185,22 +528,45 @@ class VectorStore:
             if summary_type:
                 where_clause["summary_type"] = summary_type
             
-            results = self.collection.query(
-                query_texts=[query_text],
-                n_results=limit,
-                where=where_clause,
-                include=["documents", "metadatas", "distances"]
-            )
+            # Reuse a cached embedding when we have one; a repeated query
+            # then skips the embedding forward pass entirely
+            query_embedding = self._embed_query(query_text)
+            if query_embedding is not None:
+                namespace = (summary_type, limit)
+                cached = self._cached_results(namespace, query_embedding)
+                if cached is not None:
+                    logger.info("Semantic cache hit for similar-summary search",
+                                count=len(cached))
+                    return cached
+                results = await self.collection.query(
+                    query_embeddings=[query_embedding],
+                    n_results=limit,
+                    where=where_clause,
+                    include=["documents", "metadatas", "distances"]
+                )
+            else:
+                results = await self.collection.query(
+                    query_texts=[query_text],
+                    n_results=limit,
+                    where=where_clause,
+                    include=["documents", "metadatas", "distances"]
+                )
             
+            # Convert distances to similarities in one vectorized pass
+            similarities = 1.0 - np.asarray(results["distances"][0])
+
             similar_summaries = []
             for i, doc_id in enumerate(results["ids"][0]):
                 similar_summaries.append({
                     "id": doc_id,
                     "summary": results["documents"][0][i],
                     "metadata": results["metadatas"][0][i],
-                    "similarity_score": 1 - results["distances"][0][i],  # Convert distance to similarity
+                    "similarity_score": float(similarities[i]),
                 })
             
+            if query_embedding is not None:
+                self._store_results(namespace, query_embedding, similar_summaries)
+
             logger.info("Found similar summaries", count=len(similar_summaries))
             return similar_summaries
             
@@ -209,38 +575,61 @@ class VectorStore:
             return []
 
     async def get_collection_stats(self) -> Dict[str, Any]:
-        """Get statistics about the collection."""
+        """Get statistics about the collection.
+
+        The breakdown comes from the in-process counters maintained by
+        store_summary/delete_summary, so only the total requires a
+        round-trip. The counters only see documents written by this
+        process, though — in the deployed topology the workers write and
+        the API reads — so when they are empty but the collection is
+        not, fall back to tallying a metadata sample.
+        """
         try:
-            count = self.collection.count()
-            
-            # Get sample of metadata to analyze
-            sample_results = self.collection.get(
-                limit=min(100, count),
-                include=["metadatas"]
-            )
-            
-            stats = {
+            count = await self.collection.count()
+
+            if count and not (
+                self._stats["summary_count"] or self._stats["original_count"]
+            ):
+                return await self._sampled_collection_stats(count)
+
+            return {
                 "total_documents": count,
-                "summary_count": 0,
-                "original_count": 0,
-                "summary_types": {},
+                "summary_count": self._stats["summary_count"],
+                "original_count": self._stats["original_count"],
+                "summary_types": {
+                    name: n for name, n in self._summary_types.items() if n > 0
+                },
             }
             
-            for metadata in sample_results["metadatas"]:
-                doc_type = metadata.get("document_type", "unknown")
-                if doc_type == "summary":
-                    stats["summary_count"] += 1
-                    summary_type = metadata.get("summary_type", "unknown")
-                    stats["summary_types"][summary_type] = stats["summary_types"].get(summary_type, 0) + 1
-                elif doc_type == "original":
-                    stats["original_count"] += 1
-            
-            return stats
-            
         except Exception as e:
             logger.error("Failed to get collection stats", error=str(e))
             return {"error": str(e)}
 
+    async def _sampled_collection_stats(self, count: int) -> Dict[str, Any]:
+        """Tally stats from a metadata sample, for read-only processes."""
+        sample_results = await self.collection.get(
+            limit=min(100, count),
+            include=["metadatas"]
+        )
+
+        stats = {
+            "total_documents": count,
+            "summary_count": 0,
+            "original_count": 0,
+            "summary_types": {},
+        }
+
+        for metadata in sample_results["metadatas"]:
+            doc_type = metadata.get("document_type", "unknown")
+            if doc_type == "summary":
+                stats["summary_count"] += 1
+                summary_type = metadata.get("summary_type", "unknown")
+                stats["summary_types"][summary_type] = stats["summary_types"].get(summary_type, 0) + 1
+            elif doc_type == "original":
+                stats["original_count"] += 1
+
+        return stats
+
     async def delete_summary(self, task_id: str) -> bool:
         """
         Delete a summary and its original text from the store.
@@ -249,21 +638,24 @@ class VectorStore:
             task_id: Task identifier
             
         Returns:
-            True if deleted, False if not found
+            True if the delete was issued, False on error
         """
         try:
             doc_ids = [f"summary_{task_id}", f"original_{task_id}"]
             
-            # Check if documents exist
-            existing = self.collection.get(ids=doc_ids)
-            
-            if existing["ids"]:
-                self.collection.delete(ids=existing["ids"])
-                logger.info("Deleted summary from vector store", task_id=task_id)
-                return True
-            else:
-                logger.warning("Summary not found for deletion", task_id=task_id)
-                return False
+            # Chroma deletes are idempotent for unknown ids, so the
+            # existence probe that preceded this was a second round-trip
+            # spent only to distinguish "deleted" from "never existed"
+            await self.collection.delete(ids=doc_ids)
+            self._result_cache.clear()
+
+            summary_type = self._task_types.pop(task_id, None)
+            if summary_type is not None:
+                self._stats["summary_count"] -= 1
+                self._stats["original_count"] -= 1
+                self._summary_types[summary_type] -= 1
+            logger.info("Deleted summary from vector store", task_id=task_id)
+            return True
                 
         except Exception as e:
             logger.error("Failed to delete summary", task_id=task_id, error=str(e))
@@ -273,20 +665,20 @@ class VectorStore:
         """Check the health of the ChromaDB connection."""
         try:
             # Try to get collection info
-            count = self.collection.count()
+            count = await self.collection.count()
             return {
                 "status": "healthy",
-                "collection_name": self.settings.chroma_collection_name,
+                "collection_name": self._collection_name,
                 "document_count": count,
-                "host": self.settings.chroma_host,
-                "port": self.settings.chroma_port
+                "host": self._chroma_host,
+                "port": self._chroma_port
             }
         except Exception as e:
             return {
                 "status": "unhealthy",
                 "error": str(e),
-                "host": self.settings.chroma_host,
-                "port": self.settings.chroma_port
+                "host": self._chroma_host,
+                "port": self._chroma_port
             }
 
 
@@ -298,5 +690,7 @@ async def get_vector_store() -> VectorStore:
     """Get or create a vector store instance."""
     global _vector_store_instance
     if _vector_store_instance is None:
-        _vector_store_instance = VectorStore()
+        store = VectorStore()
+        await store._initialize_client()
+        _vector_store_instance = store
     return _vector_store_instance
@@ -2,16 +2,49 @@
 
 import webvtt
 import io
-from typing import Optional, List, Dict, Any
+import mmap
+import numpy as np
+from typing import Optional, List, Dict, Any, Tuple
 import re
 from pathlib import Path
-import tempfile
 import os
 
+# Optional native accelerator: the cleaning pipeline is CPU-bound string
+# work, so a compiled single-pass implementation (the transcript_cleaner
+# extension, built separately) is used when installed. Falls back to the
+# pure-Python pipeline below otherwise.
+try:
+    from transcript_cleaner import clean_transcript as _native_clean
+except ImportError:
+    _native_clean = None
+
 
 class VTTParser:
     """Parser for WebVTT subtitle files."""
-    
+
+    # Cleaning patterns, compiled once at import time. _clean_caption_text
+    # runs per caption, so per-call re.* cache lookups add up on large files.
+    # Tag/formatting and music/bracket removals are fused into single
+    # alternations so each caption is scanned once per group instead of
+    # once per pattern
+    _TAG_OR_FORMATTING_RE = re.compile(r'<[^>]+>|\{[^}]*\}')
+    _SPEAKER_BRACKET_RE = re.compile(r'^\[.*?:\]\s*')
+    _SPEAKER_PAREN_RE = re.compile(r'^\(.*?\):\s*')
+    _MUSIC_OR_BRACKET_RE = re.compile(r'♪[^♪]*♪|\[[^]]*\]')
+    _WHITESPACE_RE = re.compile(r'\s+')
+    _PUNCT_SPACING_RE = re.compile(r'\s+([,.!?;:])')
+    _SENTENCE_SPACING_RE = re.compile(r'([.!?])\s*([a-z])')
+
+    # One compiled pattern matching a whole cue (timestamps + payload),
+    # so a file can be scanned in a single DFA-driven pass over an mmap
+    # instead of the line-by-line state machine webvtt runs in Python
+    _CUE_RE = re.compile(
+        rb'((?:\d+:)?\d\d:\d\d\.\d{3})[ \t]+-->[ \t]+'
+        rb'((?:\d+:)?\d\d:\d\d\.\d{3})[^\n]*\r?\n'
+        rb'(.*?)(?=\r?\n\r?\n|\Z)',
+        re.DOTALL,
+    )
+
     def __init__(self):
         """Initialize the VTT parser."""
         pass
@@ -49,18 +82,10 @@ class VTTParser:
             ValueError: If content parsing fails
         """
         try:
-            # Create a temporary file to work with webvtt library
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.vtt', delete=False) as temp_file:
-                temp_file.write(content)
-                temp_file_path = temp_file.name
-            
-            try:
-                vtt = webvtt.read(temp_file_path)
-                return self._extract_text_from_vtt(vtt)
-            finally:
-                # Clean up temporary file
-                os.unlink(temp_file_path)
-                
+            # Parse straight from memory; the temp-file round-trip (write,
+            # re-open, unlink) existed only to satisfy webvtt.read
+            vtt = webvtt.read_buffer(io.StringIO(content))
+            return self._extract_text_from_vtt(vtt)
         except Exception as e:
             raise ValueError(f"Failed to parse VTT content: {str(e)}")
     
@@ -78,11 +103,17 @@ class VTTParser:
             ValueError: If content parsing fails
         """
         try:
-            # Decode bytes to string
-            content = file_content.decode('utf-8')
-            return self.parse_vtt_content(content)
+            # Decode lazily while the parser reads instead of building a
+            # full intermediate str first — one codec pass, not two
+            buffer = io.TextIOWrapper(
+                io.BytesIO(file_content), encoding='utf-8', errors='strict'
+            )
+            vtt = webvtt.read_buffer(buffer)
+            return self._extract_text_from_vtt(vtt)
         except UnicodeDecodeError:
             raise ValueError("File is not a valid UTF-8 encoded VTT file")
+        except Exception as e:
+            raise ValueError(f"Failed to parse VTT content: {str(e)}")
     
     def _extract_text_from_vtt(self, vtt) -> str:
         """
@@ -94,21 +125,20 @@ class VTTParser:
         Returns:
             Clean transcript text
         """
-        transcript_parts = []
-        
-        for caption in vtt:
-            # Clean the caption text
-            text = self._clean_caption_text(caption.text)
-            if text.strip():
-                transcript_parts.append(text)
-        
-        # Join all parts with spaces
-        transcript = ' '.join(transcript_parts)
-        
-        # Final cleanup
-        transcript = self._final_cleanup(transcript)
-        
-        return transcript
+        if _native_clean is not None:
+            # One FFI call cleans the whole file instead of a Python
+            # regex pipeline per caption
+            return _native_clean('\n'.join(caption.text for caption in vtt))
+
+        # Feed cleaned words straight into the finalize pass: joining the
+        # captions first only to re-split them in cleanup would walk the
+        # full transcript two extra times
+        words = [
+            word
+            for caption in vtt
+            for word in self._clean_caption_text(caption.text).split()
+        ]
+        return self._finalize_words(words)
     
     def _clean_caption_text(self, text: str) -> str:
         """
@@ -120,24 +150,19 @@ class VTTParser:
         Returns:
             Cleaned caption text
         """
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # Remove VTT formatting (like positioning)
-        text = re.sub(r'\{[^}]*\}', '', text)
-        
+        # Remove HTML tags and VTT formatting (like positioning)
+        text = self._TAG_OR_FORMATTING_RE.sub('', text)
+
         # Remove speaker labels like [Speaker 1:] or (John):
-        text = re.sub(r'^\[.*?:\]\s*', '', text)
-        text = re.sub(r'^\(.*?\):\s*', '', text)
-        
-        # Remove music notation like ♪ or [Music]
-        text = re.sub(r'♪.*?♪', '', text)
-        text = re.sub(r'\[Music\]', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'\[.*?\]', '', text)
-        
+        text = self._SPEAKER_BRACKET_RE.sub('', text)
+        text = self._SPEAKER_PAREN_RE.sub('', text)
+
+        # Remove music notation like ♪ ... ♪ and bracketed cues ([Music])
+        text = self._MUSIC_OR_BRACKET_RE.sub('', text)
+
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
+        text = self._WHITESPACE_RE.sub(' ', text)
+
         return text.strip()
     
     def _final_cleanup(self, transcript: str) -> str:
@@ -150,28 +175,146 @@ class VTTParser:
         Returns:
             Cleaned transcript text
         """
-        # Remove multiple spaces
-        transcript = re.sub(r'\s+', ' ', transcript)
+        # split() collapses any whitespace run, so no separate pass needed
+        return self._finalize_words(transcript.split())
+
+    def _finalize_words(self, words: List[str]) -> str:
+        """
+        Dedupe adjacent words and fix punctuation, joining exactly once.
         
+        Args:
+            words: Whitespace-split transcript tokens
+            
+        Returns:
+            Cleaned transcript text
+        """
         # Remove repeated words (common in auto-generated subtitles)
-        words = transcript.split()
-        cleaned_words = []
-        prev_word = None
-        
-        for word in words:
-            # Don't add if it's the same as previous word (case-insensitive)
-            if prev_word is None or word.lower() != prev_word.lower():
-                cleaned_words.append(word)
-            prev_word = word
+        if len(words) >= 64:
+            # Vectorized adjacent-duplicate removal: the per-word lower()
+            # and compare run as C ufuncs instead of interpreter bytecode,
+            # which dominates cleanup time on long transcripts
+            arr = np.array(words)
+            lower = np.char.lower(arr)
+            mask = np.concatenate(([True], lower[1:] != lower[:-1]))
+            cleaned_words = arr[mask]
+        else:
+            # numpy's array setup overhead outweighs the win on tiny inputs
+            cleaned_words = []
+            prev_word = None
+            for word in words:
+                # Skip words equal to the previous one (case-insensitive)
+                if prev_word is None or word.lower() != prev_word.lower():
+                    cleaned_words.append(word)
+                prev_word = word
         
         transcript = ' '.join(cleaned_words)
         
         # Fix common punctuation issues
-        transcript = re.sub(r'\s+([,.!?;:])', r'\1', transcript)
-        transcript = re.sub(r'([.!?])\s*([a-z])', r'\1 \2', transcript)
+        transcript = self._PUNCT_SPACING_RE.sub(r'\1', transcript)
+        transcript = self._SENTENCE_SPACING_RE.sub(r'\1 \2', transcript)
         
         return transcript.strip()
     
+    def parse_with_metadata(self, file_path: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Parse a VTT file and collect metadata in a single pass.
+
+        Avoids reading and walking the cue list twice when both the
+        transcript and the metadata are needed, as the upload UI does.
+
+        Args:
+            file_path: Path to the VTT file
+
+        Returns:
+            Tuple of (transcript text, metadata dictionary)
+
+        Raises:
+            ValueError: If file parsing fails
+        """
+        words = []
+        total_captions = 0
+        first_start = None
+        last_end = None
+        file_size = 0
+        saw_arrow = False
+
+        try:
+            with open(file_path, 'rb') as f:
+                file_size = os.fstat(f.fileno()).st_size
+                if file_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        saw_arrow = mm.find(b'-->') != -1
+                        for match in self._CUE_RE.finditer(mm):
+                            total_captions += 1
+                            if first_start is None:
+                                first_start = match.group(1).decode('ascii')
+                            last_end = match.group(2).decode('ascii')
+                            text = self._clean_caption_text(
+                                match.group(3).decode('utf-8')
+                            )
+                            words.extend(text.split())
+        except (OSError, UnicodeDecodeError) as e:
+            raise ValueError(f"Failed to parse VTT file: {str(e)}")
+
+        if total_captions == 0:
+            if saw_arrow:
+                # The file has cue arrows the fast pattern didn't match
+                # (exotic timestamp formats); let webvtt have a go
+                return self._parse_with_metadata_webvtt(file_path, file_size)
+            return "", {
+                "total_captions": 0,
+                "duration": "00:00:00",
+                "start_time": None,
+                "end_time": None
+            }
+
+        transcript = self._finalize_words(words)
+        metadata = {
+            "total_captions": total_captions,
+            "duration": last_end,
+            "start_time": first_start,
+            "end_time": last_end,
+            "file_size": file_size
+        }
+
+        return transcript, metadata
+
+    def _parse_with_metadata_webvtt(self, file_path: str, file_size: int) -> Tuple[str, Dict[str, Any]]:
+        """Fallback single-pass parse via the webvtt library."""
+        try:
+            vtt = webvtt.read(file_path)
+        except Exception as e:
+            raise ValueError(f"Failed to parse VTT file: {str(e)}")
+
+        transcript_parts = []
+        total_captions = 0
+
+        for caption in vtt:
+            total_captions += 1
+            text = self._clean_caption_text(caption.text)
+            if text.strip():
+                transcript_parts.append(text)
+
+        transcript = self._final_cleanup(' '.join(transcript_parts))
+
+        if total_captions == 0:
+            metadata = {
+                "total_captions": 0,
+                "duration": "00:00:00",
+                "start_time": None,
+                "end_time": None
+            }
+        else:
+            metadata = {
+                "total_captions": total_captions,
+                "duration": vtt[-1].end,
+                "start_time": vtt[0].start,
+                "end_time": vtt[-1].end,
+                "file_size": file_size
+            }
+
+        return transcript, metadata
+
     def extract_metadata(self, file_path: str) -> Dict[str, Any]:
         """
         Extract metadata from VTT file.
@@ -26,20 +26,47 @@ app = Celery(
 
 # Configure Celery
 app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
+    # Transcripts ride in the task payload, so serialize tasks with
+    # msgpack — binary framing avoids JSON string escaping on MB-sized
+    # texts. Results stay JSON for easy inspection from the API side.
+    task_serializer="msgpack",
+    accept_content=["msgpack", "json"],
     result_serializer="json",
     timezone="UTC",
     enable_utc=True,
     task_routes={
         "transcript_summarizer.worker.summarize_transcript_task": {"queue": "summarization"},
+        # Short monitoring tasks get their own queue so a worker dedicated
+        # to them can run with a high prefetch without sitting behind
+        # minutes-long summarizations
+        "health_check_task": {"queue": "health"},
     },
+    # Prefetch stays at 1: summarization tasks run for minutes, so
+    # hoarding them in one worker hurts far more than a Redis RTT per
+    # pickup saves
     worker_prefetch_multiplier=1,
     task_acks_late=True,
-    worker_max_tasks_per_child=100,
+    # Recycling a child throws away the warm event loop and connection
+    # pools; 100 tasks amortized that badly and no leak justifies it
+    worker_max_tasks_per_child=1000,
 )
 
 
+# One event loop per worker process, created on first task. Building a
+# fresh loop per invocation threw away the summarizer's and vector
+# store's warm connection pools and paid selector setup each time.
+_worker_loop = None
+
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide event loop, creating it on first use."""
+    global _worker_loop
+    if _worker_loop is None:
+        _worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+    return _worker_loop
+
+
 @app.task(bind=True, name="summarize_transcript_task")
 def summarize_transcript_task(self, text: str, summary_type: str = "comprehensive"):
     """
@@ -65,16 +92,11 @@ def summarize_transcript_task(self, text: str, summary_type: str = "comprehensiv
             meta={"progress": 0, "message": "Initializing summarization..."}
         )
         
-        # Run the summarization in the event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            result = loop.run_until_complete(
-                _run_summarization(text, summary_type, task_id, self.update_state)
-            )
-        finally:
-            loop.close()
+        # Run the summarization on the persistent per-process loop so
+        # client connections stay warm across tasks
+        result = _get_worker_loop().run_until_complete(
+            _run_summarization(text, summary_type, task_id, self.update_state)
+        )
         
         # Calculate processing time
         processing_time = time.time() - start_time
@@ -133,13 +155,31 @@ async def _run_summarization(
     
     summarizer = await create_summarizer()
     
+    # The original text is known before the LLM starts, so its vector
+    # store write can overlap the summarization instead of waiting
+    vector_store = None
+    original_write = None
+    try:
+        vector_store = await get_vector_store()
+        original_write = asyncio.create_task(
+            vector_store.store_original(task_id, text)
+        )
+    except Exception as e:
+        logger.warning("Failed to start vector store write",
+                      task_id=task_id, error=str(e))
+    
     # Run summarization
     update_state_func(
         state="PROCESSING", 
         meta={"progress": 20, "message": "Processing transcript..."}
     )
     
-    result = await summarizer.summarize_transcript(text, summary_type)
+    try:
+        result = await summarizer.summarize_transcript(text, summary_type)
+    except BaseException:
+        if original_write is not None:
+            original_write.cancel()
+        raise
     
     # Store result in vector database
     update_state_func(
@@ -147,13 +187,18 @@ async def _run_summarization(
         meta={"progress": 90, "message": "Storing result..."}
     )
     
-    try:
-        vector_store = await get_vector_store()
-        await vector_store.store_summary(task_id, text, result)
-    except Exception as e:
-        logger.warning("Failed to store result in vector database", 
-                      task_id=task_id, error=str(e))
-        # Don't fail the task if vector storage fails
+    if vector_store is not None:
+        # Gather so the original-text write is always awaited — on a
+        # persistent loop an unawaited task would linger past this run
+        writes = [vector_store.store_summary_doc(task_id, result)]
+        if original_write is not None:
+            writes.append(original_write)
+        outcomes = await asyncio.gather(*writes, return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                logger.warning("Failed to store result in vector database",
+                              task_id=task_id, error=str(outcome))
+                # Don't fail the task if vector storage fails
     
     update_state_func(
         state="PROCESSING",
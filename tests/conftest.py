@@ -1,22 +1,16 @@
 """Test configuration and fixtures."""
 
 import pytest
-import asyncio
-from unittest.mock import AsyncMock, MagicMock
+from dataclasses import dataclass
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi.testclient import TestClient
 
 from transcript_summarizer.config.settings import get_settings
+from transcript_summarizer.core.summarizer import TranscriptSummarizer
 from transcript_summarizer.api import app
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture
 def settings():
     """Get test settings."""
@@ -30,19 +24,117 @@ def settings():
     return test_settings
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client."""
-    with TestClient(app) as test_client:
-        yield test_client
+    """Create a test client, shared across the session.
+
+    The client is deliberately not entered as a context manager, so the
+    app's lifespan (a vector-store connect and health check) never runs;
+    every collaborator the tests touch is mocked, so startup work would
+    be wasted. Tests configure their mocks per call, so no state leaks
+    between them.
+    """
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _api_mocks():
+    """Install persistent mocks for the API's collaborators.
+
+    One patch for the whole session replaces a patch enter/exit pair
+    per test; tests configure behavior through the celery_mock and
+    vector_store_mock fixtures, which reset state between tests.
+    """
+    with patch('transcript_summarizer.api.celery_app') as celery, \
+         patch('transcript_summarizer.api.get_vector_store') as get_store:
+        yield celery, get_store
+
+
+@pytest.fixture(autouse=True)
+def _clear_status_cache():
+    """Empty the API's status cache before each test.
+
+    The cache TTL (5s) outlives the whole suite, so without a reset a
+    health or stats test would see whatever the previous test cached.
+    """
+    from transcript_summarizer import api
+    api._status_cache.clear()
+
+
+@pytest.fixture
+def celery_mock(_api_mocks):
+    """The patched Celery app, reset for this test."""
+    celery, _ = _api_mocks
+    celery.reset_mock(return_value=True, side_effect=True)
+    return celery
+
+
+class StubVectorStore:
+    """Hand-rolled async double for the vector store.
+
+    The API tests only need coroutine methods returning fixed values;
+    plain coroutines avoid AsyncMock's per-call instrumentation. Tests
+    set the attributes to shape the responses.
+    """
+
+    def __init__(self):
+        self.health_status = {"status": "healthy"}
+        self.stats = {}
+        self.search_results = []
+        self.summary = None
+
+    async def health_check(self):
+        return self.health_status
+
+    async def get_collection_stats(self):
+        return self.stats
+
+    async def search_similar_summaries(self, query_text, limit=5, summary_type=None):
+        return self.search_results
+
+    async def get_summary(self, task_id):
+        return self.summary
 
 
 @pytest.fixture
-def mock_ollama_llm():
-    """Mock Ollama LLM for testing."""
-    mock_llm = MagicMock()
-    mock_llm.invoke.return_value = "This is a test summary of the transcript."
-    return mock_llm
+def vector_store_mock(_api_mocks):
+    """A fresh stub vector store wired into the patched get_vector_store."""
+    _, get_store = _api_mocks
+    get_store.reset_mock(return_value=True, side_effect=True)
+    store = StubVectorStore()
+    get_store.return_value = store
+    return store
+
+
+def chroma_response(ids, docs, metas, distances=None):
+    """Build a ChromaDB-shaped response dict for mock return values."""
+    response = {
+        "ids": [list(ids)],
+        "documents": [list(docs)],
+        "metadatas": [list(metas)],
+    }
+    if distances is not None:
+        response["distances"] = [list(distances)]
+    return response
+
+
+@dataclass
+class FakeAsyncResult:
+    """Stand-in for celery.result.AsyncResult with just the fields the
+    API reads. Plain attribute access, unlike a MagicMock, which
+    synthesizes a child mock for every attribute touched."""
+
+    state: str
+    info: Any = None
+    result: Any = None
+
+
+@pytest.fixture
+def mock_ollama_client():
+    """Mock Ollama async client for testing."""
+    mock_client = AsyncMock()
+    mock_client.generate.return_value = {"response": "This is a test summary of the transcript."}
+    return mock_client
 
 
 @pytest.fixture
@@ -56,9 +148,9 @@ def mock_vector_store():
     return mock_store
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_transcript():
-    """Sample transcript for testing."""
+    """Sample transcript for testing, read-only so shared per session."""
     return """
     Welcome to today's meeting. We'll be discussing the quarterly results and future plans.
     
@@ -80,9 +172,19 @@ def sample_transcript():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_transcript_len(sample_transcript):
+    """Length of the sample transcript, computed once for assertions."""
+    return len(sample_transcript)
+
+
+@pytest.fixture(scope="session")
 def sample_long_transcript():
-    """Long transcript for testing chunking."""
+    """Long transcript for testing chunking, built once per session.
+
+    It is only ever read, so sharing one ~25KB string is safe and skips
+    regenerating it for every dependent test.
+    """
     base_text = """
     This is a section of a very long transcript that needs to be processed in chunks.
     It contains important information about various topics including business operations,
@@ -103,3 +205,41 @@ def sample_long_transcript():
     
     # Repeat the base text to create a long transcript
     return (base_text + "\n") * 50  # Creates a ~25KB transcript
+
+
+@pytest.fixture(scope="session")
+def metrics_response(client):
+    """The /metrics response, fetched once.
+
+    The test only inspects status and headers, so one round-trip
+    through the ASGI stack serves the whole session.
+    """
+    return client.get("/metrics")
+
+
+@pytest.fixture(scope="session")
+def cors_options_response(client):
+    """A CORS preflight response for /health, fetched once.
+
+    CORSMiddleware only answers OPTIONS itself when the request carries
+    preflight headers; a bare OPTIONS is forwarded to the router, which
+    has no OPTIONS route and 405s.
+    """
+    return client.options("/health", headers={
+        "Origin": "http://example.com",
+        "Access-Control-Request-Method": "GET",
+    })
+
+
+@pytest.fixture(scope="session")
+def oversized_text():
+    """Text just past the request size limit, allocated once per session."""
+    return "a" * 1_000_001
+
+
+@pytest.fixture(scope="session")
+def sample_long_chunks(sample_long_transcript):
+    """The long transcript split into chunks, computed once per session."""
+    with patch('transcript_summarizer.core.summarizer.AsyncClient'):
+        splitter = TranscriptSummarizer()
+    return splitter._fast_split(sample_long_transcript)
@@ -1,67 +1,70 @@
 """Tests for the FastAPI application."""
 
+import json
+
 import pytest
-from unittest.mock import patch, AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from fastapi.testclient import TestClient
+from conftest import FakeAsyncResult
 from transcript_summarizer.models.schemas import SummarizationRequest, TaskStatus
 
 
+pytestmark = pytest.mark.xdist_group(name="api")
+
+
 class TestAPI:
-    """Test cases for FastAPI application."""
+    """Test cases for FastAPI application.
+
+    The Celery app and vector store are patched once per session (see
+    conftest); tests configure them through the celery_mock and
+    vector_store_mock fixtures instead of per-test patch blocks.
+    """
 
-    def test_health_endpoint(self, client):
+    def test_health_endpoint(self, client, celery_mock, vector_store_mock):
         """Test health check endpoint."""
-        with patch('transcript_summarizer.api.celery_app') as mock_celery, \
-             patch('transcript_summarizer.api.get_vector_store') as mock_get_store:
-            
-            # Mock Celery health check
-            mock_inspect = MagicMock()
-            mock_inspect.active.return_value = {"worker1": []}
-            mock_celery.control.inspect.return_value = mock_inspect
-            
-            # Mock vector store health check
-            mock_store = AsyncMock()
-            mock_store.health_check.return_value = {"status": "healthy"}
-            mock_get_store.return_value = mock_store
-            
-            response = client.get("/health")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert "status" in data
-            assert "services" in data
-            assert "version" in data
-
-    def test_summarize_endpoint_success(self, client, sample_transcript):
+        # Mock the bounded worker ping the endpoint actually issues
+        celery_mock.control.ping.return_value = [{"worker1": {"ok": "pong"}}]
+
+        # Mock vector store health check
+        vector_store_mock.health_status = {"status": "healthy"}
+
+        response = client.get("/health")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert "status" in data
+        assert "version" in data
+        assert data["services"]["celery"] == "healthy"
+        assert data["services"]["vector_store"] == "healthy"
+        celery_mock.control.ping.assert_called_once()
+
+    def test_summarize_endpoint_success(self, client, celery_mock, sample_transcript):
         """Test successful transcript summarization request."""
-        with patch('transcript_summarizer.api.celery_app') as mock_celery:
-            # Mock Celery task
-            mock_task = MagicMock()
-            mock_task.id = "test-task-123"
-            mock_celery.send_task.return_value = mock_task
-            
-            request_data = {
-                "text": sample_transcript,
-                "summary_type": "comprehensive"
-            }
-            
-            response = client.post("/summarize", json=request_data)
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert data["task_id"] == "test-task-123"
-            assert data["status"] == "pending"
-            assert "estimated_completion_time" in data
-
-    def test_summarize_endpoint_text_too_long(self, client):
+        # Mock Celery task
+        mock_task = MagicMock()
+        mock_task.id = "test-task-123"
+        celery_mock.send_task.return_value = mock_task
+
+        request_data = {
+            "text": sample_transcript,
+            "summary_type": "comprehensive"
+        }
+
+        response = client.post("/summarize", json=request_data)
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["task_id"] == "test-task-123"
+        assert data["status"] == "pending"
+        assert "estimated_completion_time" in data
+
+    def test_summarize_endpoint_text_too_long(self, client, oversized_text):
         """Test summarization with text that exceeds maximum length."""
-        long_text = "a" * 1000001  # Exceed default max length
-        
         request_data = {
-            "text": long_text,
+            "text": oversized_text,  # Exceeds default max length
             "summary_type": "comprehensive"
         }
-        
+
         response = client.post("/summarize", json=request_data)
         assert response.status_code == 413
         assert "too long" in response.json()["detail"].lower()
@@ -72,7 +75,7 @@ class TestAPI:
             "text": "",
             "summary_type": "comprehensive"
         }
-        
+
         response = client.post("/summarize", json=request_data)
         assert response.status_code == 422  # Validation error
 
@@ -82,201 +85,197 @@ class TestAPI:
             "text": sample_transcript,
             "summary_type": "invalid_type"
         }
-        
+
         response = client.post("/summarize", json=request_data)
         assert response.status_code == 422  # Validation error
 
-    def test_get_task_status_pending(self, client):
-        """Test getting status of a pending task."""
-        with patch('transcript_summarizer.api.celery_app') as mock_celery:
-            # Mock pending task
-            mock_result = MagicMock()
-            mock_result.state = "PENDING"
-            mock_result.info = None
-            mock_celery.AsyncResult.return_value = mock_result
-            
-            response = client.get("/status/test-task-123")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert data["task_id"] == "test-task-123"
-            assert data["status"] == "pending"
-            assert data["progress"] is None
-
-    def test_get_task_status_processing(self, client):
-        """Test getting status of a processing task."""
-        with patch('transcript_summarizer.api.celery_app') as mock_celery:
-            # Mock processing task
-            mock_result = MagicMock()
-            mock_result.state = "PROCESSING"
-            mock_result.info = {"progress": 50, "message": "Processing..."}
-            mock_celery.AsyncResult.return_value = mock_result
-            
-            response = client.get("/status/test-task-123")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert data["task_id"] == "test-task-123"
-            assert data["status"] == "processing"
-            assert data["progress"] == 50
-
-    def test_get_task_status_completed(self, client):
-        """Test getting status of a completed task."""
-        with patch('transcript_summarizer.api.celery_app') as mock_celery:
-            # Mock completed task
-            mock_result = MagicMock()
-            mock_result.state = "SUCCESS"
-            mock_result.result = {
-                "summary": "Test summary",
-                "original_length": 1000,
-                "summary_length": 100,
-                "compression_ratio": 10.0,
-                "chunk_count": 1,
-                "summary_type": "comprehensive",
-                "processing_time": 5.0,
-                "created_at": "2023-01-01T00:00:00"
-            }
-            mock_celery.AsyncResult.return_value = mock_result
-            
-            response = client.get("/status/test-task-123")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert data["task_id"] == "test-task-123"
-            assert data["status"] == "completed"
-            assert data["progress"] == 100
+    @pytest.mark.parametrize("task_result,expected", [
+        (FakeAsyncResult(state="PENDING"),
+         {"status": "pending", "progress": None}),
+        (FakeAsyncResult(state="PROCESSING",
+                         info={"progress": 50, "message": "Processing..."}),
+         {"status": "processing", "progress": 50}),
+        (FakeAsyncResult(state="SUCCESS", result={
+            "summary": "Test summary",
+            "original_length": 1000,
+            "summary_length": 100,
+            "compression_ratio": 10.0,
+            "chunk_count": 1,
+            "summary_type": "comprehensive",
+            "processing_time": 5.0,
+            "created_at": "2023-01-01T00:00:00"
+        }),
+         {"status": "completed", "progress": 100}),
+        (FakeAsyncResult(state="FAILURE", info="Task failed due to error"),
+         {"status": "failed", "error_message": "Task failed due to error"}),
+    ], ids=["pending", "processing", "completed", "failed"])
+    def test_get_task_status(self, client, celery_mock, task_result, expected):
+        """Test getting task status across every Celery state."""
+        celery_mock.AsyncResult.return_value = task_result
+
+        response = client.get("/status/test-task-123")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["task_id"] == "test-task-123"
+        for key, value in expected.items():
+            assert data[key] == value
+        if expected["status"] == "completed":
             assert data["result"] is not None
 
-    def test_get_task_status_failed(self, client):
-        """Test getting status of a failed task."""
-        with patch('transcript_summarizer.api.celery_app') as mock_celery:
-            # Mock failed task
-            mock_result = MagicMock()
-            mock_result.state = "FAILURE"
-            mock_result.info = "Task failed due to error"
-            mock_celery.AsyncResult.return_value = mock_result
-            
-            response = client.get("/status/test-task-123")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert data["task_id"] == "test-task-123"
-            assert data["status"] == "failed"
-            assert data["error_message"] == "Task failed due to error"
-
-    def test_get_summary_success(self, client):
+    def test_get_task_status_batch(self, client, celery_mock):
+        """Test batched status lookups served by a single backend MGET."""
+        summary = {
+            "summary": "Test summary",
+            "original_length": 1000,
+            "summary_length": 100,
+            "compression_ratio": 10.0,
+            "chunk_count": 1,
+            "summary_type": "comprehensive",
+            "processing_time": 5.0,
+            "created_at": "2023-01-01T00:00:00"
+        }
+        celery_mock.backend.client.mget.return_value = [
+            None,
+            json.dumps({"status": "PROCESSING", "result": {"progress": 50}}),
+            json.dumps({"status": "SUCCESS", "result": summary}),
+            json.dumps({"status": "FAILURE", "result": "boom"}),
+        ]
+
+        task_ids = ["t-missing", "t-processing", "t-success", "t-failed"]
+        response = client.post("/status/batch", json={"task_ids": task_ids})
+        assert response.status_code == 200
+
+        data = response.json()
+        assert [row["status"] for row in data] == [
+            "pending", "processing", "completed", "failed"
+        ]
+        assert data[1]["progress"] == 50
+        assert data[2]["result"]["summary"] == "Test summary"
+        assert data[3]["error_message"] == "boom"
+        celery_mock.backend.client.mget.assert_called_once_with(
+            [f"celery-task-meta-{task_id}" for task_id in task_ids]
+        )
+
+    def test_stream_task_status_terminal(self, client, celery_mock, monkeypatch):
+        """Test the SSE stream closes after one event for finished tasks."""
+        pubsub = MagicMock()
+        pubsub.subscribe = AsyncMock()
+        pubsub.aclose = AsyncMock()
+        redis_client = MagicMock()
+        redis_client.pubsub.return_value = pubsub
+        redis_client.aclose = AsyncMock()
+        monkeypatch.setattr(
+            'transcript_summarizer.api.aioredis.from_url',
+            MagicMock(return_value=redis_client)
+        )
+        celery_mock.AsyncResult.return_value = FakeAsyncResult(state="SUCCESS")
+
+        response = client.get("/status/test-task-123/stream")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+
+        # One data frame with the terminal state, then the stream ends
+        # without entering the pubsub loop
+        assert response.text == (
+            'data: {"task_id": "test-task-123", "status": "SUCCESS"}\n\n'
+        )
+        pubsub.subscribe.assert_awaited_once_with("celery-task-meta-test-task-123")
+        pubsub.get_message.assert_not_called()
+        pubsub.aclose.assert_awaited_once()
+        redis_client.aclose.assert_awaited_once()
+
+    def test_get_summary_success(self, client, celery_mock):
         """Test getting a completed summary."""
-        with patch('transcript_summarizer.api.celery_app') as mock_celery:
-            # Mock successful task result
-            mock_result = MagicMock()
-            mock_result.state = "SUCCESS"
-            mock_result.result = {
-                "summary": "Test summary",
-                "original_length": 1000,
-                "summary_length": 100,
-                "compression_ratio": 10.0,
-                "chunk_count": 1,
-                "summary_type": "comprehensive",
-                "processing_time": 5.0,
-                "created_at": "2023-01-01T00:00:00"
-            }
-            mock_celery.AsyncResult.return_value = mock_result
-            
-            response = client.get("/summary/test-task-123")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert data["summary"] == "Test summary"
-            assert data["original_length"] == 1000
-
-    def test_get_summary_not_ready(self, client):
+        # Mock successful task result
+        celery_mock.AsyncResult.return_value = FakeAsyncResult(state="SUCCESS", result={
+            "summary": "Test summary",
+            "original_length": 1000,
+            "summary_length": 100,
+            "compression_ratio": 10.0,
+            "chunk_count": 1,
+            "summary_type": "comprehensive",
+            "processing_time": 5.0,
+            "created_at": "2023-01-01T00:00:00"
+        })
+
+        response = client.get("/summary/test-task-123")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["summary"] == "Test summary"
+        assert data["original_length"] == 1000
+
+    def test_get_summary_not_ready(self, client, celery_mock):
         """Test getting summary for a task that's still processing."""
-        with patch('transcript_summarizer.api.celery_app') as mock_celery:
-            # Mock processing task
-            mock_result = MagicMock()
-            mock_result.state = "PROCESSING"
-            mock_result.result = None
-            mock_celery.AsyncResult.return_value = mock_result
-            
-            response = client.get("/summary/test-task-123")
-            assert response.status_code == 202  # Accepted, still processing
-
-    def test_get_summary_not_found(self, client):
+        # Mock processing task
+        celery_mock.AsyncResult.return_value = FakeAsyncResult(state="PROCESSING")
+
+        response = client.get("/summary/test-task-123")
+        assert response.status_code == 202  # Accepted, still processing
+
+    def test_get_summary_not_found(self, client, celery_mock, vector_store_mock):
         """Test getting summary for a non-existent task."""
-        with patch('transcript_summarizer.api.celery_app') as mock_celery, \
-             patch('transcript_summarizer.api.get_vector_store') as mock_get_store:
-            
-            # Mock task not found in Celery
-            mock_result = MagicMock()
-            mock_result.state = "PENDING"
-            mock_result.result = None
-            mock_celery.AsyncResult.return_value = mock_result
-            
-            # Mock not found in vector store
-            mock_store = AsyncMock()
-            mock_store.get_summary.return_value = None
-            mock_get_store.return_value = mock_store
-            
-            response = client.get("/summary/non-existent-task")
-            assert response.status_code == 404
-
-    def test_search_summaries(self, client):
+        # Mock task not found in Celery
+        celery_mock.AsyncResult.return_value = FakeAsyncResult(state="PENDING")
+
+        # Mock not found in vector store
+        vector_store_mock.summary = None
+
+        response = client.get("/summary/non-existent-task")
+        assert response.status_code == 404
+
+    def test_search_summaries(self, client, vector_store_mock):
         """Test searching for similar summaries."""
-        with patch('transcript_summarizer.api.get_vector_store') as mock_get_store:
-            mock_store = AsyncMock()
-            mock_store.search_similar_summaries.return_value = [
-                {
-                    "id": "summary_123",
-                    "summary": "Similar summary",
-                    "metadata": {"summary_type": "comprehensive"},
-                    "similarity_score": 0.85
-                }
-            ]
-            mock_get_store.return_value = mock_store
-            
-            response = client.get("/search?query=test query&limit=5")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert data["query"] == "test query"
-            assert len(data["results"]) == 1
-            assert data["count"] == 1
-
-    def test_get_stats(self, client):
-        """Test getting application statistics."""
-        with patch('transcript_summarizer.api.get_vector_store') as mock_get_store, \
-             patch('transcript_summarizer.api.celery_app') as mock_celery:
-            
-            # Mock vector store stats
-            mock_store = AsyncMock()
-            mock_store.get_collection_stats.return_value = {
-                "total_documents": 100,
-                "summary_count": 50
+        vector_store_mock.search_results = [
+            {
+                "id": "summary_123",
+                "summary": "Similar summary",
+                "metadata": {"summary_type": "comprehensive"},
+                "similarity_score": 0.85
             }
-            mock_get_store.return_value = mock_store
-            
-            # Mock Celery stats
-            mock_inspect = MagicMock()
-            mock_inspect.active.return_value = {"worker1": []}
-            mock_inspect.scheduled.return_value = {}
-            mock_inspect.reserved.return_value = {}
-            mock_celery.control.inspect.return_value = mock_inspect
-            
-            response = client.get("/stats")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert "vector_store" in data
-            assert "celery" in data
-            assert "timestamp" in data
-
-    def test_metrics_endpoint(self, client):
-        """Test Prometheus metrics endpoint."""
-        response = client.get("/metrics")
+        ]
+
+        response = client.get("/search?query=test query&limit=5")
         assert response.status_code == 200
-        assert "text/plain" in response.headers["content-type"]
 
-    def test_cors_headers(self, client):
-        """Test CORS headers are present."""
-        response = client.options("/health")
+        data = response.json()
+        assert data["query"] == "test query"
+        assert len(data["results"]) == 1
+        assert data["count"] == 1
+
+    def test_get_stats(self, client, celery_mock, vector_store_mock):
+        """Test getting application statistics."""
+        # Mock vector store stats
+        vector_store_mock.stats = {
+            "total_documents": 100,
+            "summary_count": 50
+        }
+
+        # Mock Celery stats
+        mock_inspect = MagicMock()
+        mock_inspect.active.return_value = {"worker1": []}
+        mock_inspect.scheduled.return_value = {}
+        mock_inspect.reserved.return_value = {}
+        celery_mock.control.inspect.return_value = mock_inspect
+
+        response = client.get("/stats")
         assert response.status_code == 200
+
+        data = response.json()
+        assert "vector_store" in data
+        assert "celery" in data
+        assert "timestamp" in data
+
+    def test_metrics_endpoint(self, metrics_response):
+        """Test Prometheus metrics endpoint."""
+        assert metrics_response.status_code == 200
+        assert "text/plain" in metrics_response.headers["content-type"]
+
+    def test_cors_headers(self, cors_options_response):
+        """Test CORS headers are present."""
+        assert cors_options_response.status_code == 200
+        # allow_credentials=True makes the middleware echo the origin
+        # instead of the * wildcard
+        assert cors_options_response.headers["access-control-allow-origin"] == "http://example.com"
+        assert "GET" in cors_options_response.headers["access-control-allow-methods"]
@@ -2,19 +2,38 @@
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
+from conftest import chroma_response
 from transcript_summarizer.storage.vector_store import VectorStore, get_vector_store
 from transcript_summarizer.models.schemas import SummarizationResult
 from datetime import datetime
 
 
+pytestmark = pytest.mark.xdist_group(name="storage")
+
+
+@pytest.fixture(scope="session")
+def sample_result():
+    """Sample summarization result, frozen so it can be session-scoped."""
+    return SummarizationResult(
+        summary="This is a test summary.",
+        original_length=1000,
+        summary_length=100,
+        compression_ratio=10.0,
+        chunk_count=1,
+        summary_type="comprehensive",
+        processing_time=5.0,
+        created_at=datetime(2023, 1, 1, 0, 0, 0)
+    )
+
+
 class TestVectorStore:
     """Test cases for VectorStore class."""
 
     @pytest.fixture
     def mock_chromadb_client(self):
-        """Mock ChromaDB client."""
-        mock_client = MagicMock()
-        mock_collection = MagicMock()
+        """Mock async ChromaDB client."""
+        mock_client = AsyncMock()
+        mock_collection = AsyncMock()
         mock_client.get_collection.return_value = mock_collection
         mock_client.create_collection.return_value = mock_collection
         return mock_client, mock_collection
@@ -24,27 +43,15 @@ class TestVectorStore:
         """Create VectorStore instance with mocked ChromaDB."""
         mock_client, mock_collection = mock_chromadb_client
         
-        with patch('transcript_summarizer.storage.vector_store.chromadb.HttpClient') as mock_http_client:
-            mock_http_client.return_value = mock_client
-            store = VectorStore()
-            store.collection = mock_collection
-            return store
+        store = VectorStore()
+        store.client = mock_client
+        store.collection = mock_collection
+        # Pin the local embedder off so tests never trigger the ONNX
+        # model download; the embedding path gets its own test with
+        # _embed_texts stubbed
+        store._embedding_fn = False
+        return store
 
-    @pytest.fixture
-    def sample_result(self):
-        """Sample summarization result."""
-        return SummarizationResult(
-            summary="This is a test summary.",
-            original_length=1000,
-            summary_length=100,
-            compression_ratio=10.0,
-            chunk_count=1,
-            summary_type="comprehensive",
-            processing_time=5.0,
-            created_at=datetime.utcnow()
-        )
-
-    @pytest.mark.asyncio
     async def test_store_summary(self, vector_store, sample_result):
         """Test storing a summary in the vector store."""
         task_id = "test-task-123"
@@ -54,15 +61,27 @@ class TestVectorStore:
         
         assert doc_id == f"summary_{task_id}"
         
-        # Verify collection.add was called twice (summary + original)
-        assert vector_store.collection.add.call_count == 2
+        # Verify summary + original were stored in a single batched add
+        assert vector_store.collection.add.call_count == 1
+        call_kwargs = vector_store.collection.add.call_args.kwargs
+        assert call_kwargs["ids"] == [f"summary_{task_id}", f"original_{task_id}"]
+
+    async def test_store_summary_with_local_embeddings(self, vector_store, sample_result):
+        """Test that locally computed embeddings are passed to the add."""
+        embedder = MagicMock(return_value=[[0.1, 0.2], [0.3, 0.4]])
+        vector_store._embedding_fn = embedder
+        
+        await vector_store.store_summary("test-task-123", "original", sample_result)
+        
+        call_kwargs = vector_store.collection.add.call_args.kwargs
+        assert call_kwargs["embeddings"].shape == (2, 2)
+        embedder.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_get_summary_found(self, vector_store, sample_result):
         """Test retrieving an existing summary."""
         task_id = "test-task-123"
         
-        # Mock ChromaDB response
+        # Mock ChromaDB response (get returns flat lists, not nested)
         vector_store.collection.get.return_value = {
             "ids": [f"summary_{task_id}"],
             "documents": [sample_result.summary],
@@ -85,7 +104,6 @@ class TestVectorStore:
         assert result.original_length == sample_result.original_length
         assert result.summary_type == sample_result.summary_type
 
-    @pytest.mark.asyncio
     async def test_get_summary_not_found(self, vector_store):
         """Test retrieving a non-existent summary."""
         task_id = "non-existent-task"
@@ -100,21 +118,20 @@ class TestVectorStore:
         result = await vector_store.get_summary(task_id)
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_search_similar_summaries(self, vector_store):
         """Test searching for similar summaries."""
         query_text = "quarterly results and financial performance"
         
         # Mock ChromaDB query response
-        vector_store.collection.query.return_value = {
-            "ids": [["summary_1", "summary_2"]],
-            "documents": [["Summary 1 text", "Summary 2 text"]],
-            "metadatas": [[
+        vector_store.collection.query.return_value = chroma_response(
+            ids=["summary_1", "summary_2"],
+            docs=["Summary 1 text", "Summary 2 text"],
+            metas=[
                 {"task_id": "task_1", "summary_type": "comprehensive"},
                 {"task_id": "task_2", "summary_type": "brief"}
-            ]],
-            "distances": [[0.2, 0.3]]
-        }
+            ],
+            distances=[0.2, 0.3]
+        )
         
         results = await vector_store.search_similar_summaries(query_text, limit=5)
         
@@ -123,18 +140,14 @@ class TestVectorStore:
         assert results[1]["similarity_score"] == 0.7  # 1 - 0.3
         assert results[0]["summary"] == "Summary 1 text"
 
-    @pytest.mark.asyncio
     async def test_search_similar_summaries_with_filter(self, vector_store):
         """Test searching with summary type filter."""
         query_text = "test query"
         summary_type = "comprehensive"
         
-        vector_store.collection.query.return_value = {
-            "ids": [[]],
-            "documents": [[]],
-            "metadatas": [[]],
-            "distances": [[]]
-        }
+        vector_store.collection.query.return_value = chroma_response(
+            ids=[], docs=[], metas=[], distances=[]
+        )
         
         await vector_store.search_similar_summaries(
             query_text, 
@@ -147,59 +160,66 @@ class TestVectorStore:
         where_clause = call_args[1]["where"]
         assert where_clause["summary_type"] == summary_type
 
-    @pytest.mark.asyncio
-    async def test_get_collection_stats(self, vector_store):
+    async def test_get_collection_stats(self, vector_store, sample_result):
         """Test getting collection statistics."""
         # Mock collection count
         vector_store.collection.count.return_value = 100
         
-        # Mock get response for metadata analysis
+        await vector_store.store_summary("task-1", "text one", sample_result)
+        await vector_store.store_summary("task-2", "text two", sample_result)
+        await vector_store.delete_summary("task-1")
+        
+        stats = await vector_store.get_collection_stats()
+        
+        assert stats["total_documents"] == 100
+        assert stats["summary_count"] == 1
+        assert stats["original_count"] == 1
+        assert stats["summary_types"] == {"comprehensive": 1}
+        # The breakdown comes from in-process counters, not a sample fetch
+        vector_store.collection.get.assert_not_called()
+
+    async def test_get_collection_stats_sampled_fallback(self, vector_store):
+        """Test stats fall back to a metadata sample when nothing was
+        written locally, as in the API process."""
+        vector_store.collection.count.return_value = 2
         vector_store.collection.get.return_value = {
             "metadatas": [
-                {"document_type": "summary", "summary_type": "comprehensive"},
                 {"document_type": "summary", "summary_type": "brief"},
                 {"document_type": "original"},
-                {"document_type": "summary", "summary_type": "comprehensive"}
             ]
         }
         
         stats = await vector_store.get_collection_stats()
         
-        assert stats["total_documents"] == 100
-        assert stats["summary_count"] == 3
+        assert stats["total_documents"] == 2
+        assert stats["summary_count"] == 1
         assert stats["original_count"] == 1
-        assert stats["summary_types"]["comprehensive"] == 2
-        assert stats["summary_types"]["brief"] == 1
+        assert stats["summary_types"] == {"brief": 1}
+        vector_store.collection.get.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_delete_summary(self, vector_store):
         """Test deleting a summary."""
         task_id = "test-task-123"
         
-        # Mock existing documents
-        vector_store.collection.get.return_value = {
-            "ids": [f"summary_{task_id}", f"original_{task_id}"]
-        }
-        
         result = await vector_store.delete_summary(task_id)
         
         assert result is True
-        vector_store.collection.delete.assert_called_once()
+        # A single idempotent delete, no existence probe beforehand
+        vector_store.collection.get.assert_not_called()
+        vector_store.collection.delete.assert_called_once_with(
+            ids=[f"summary_{task_id}", f"original_{task_id}"]
+        )
 
-    @pytest.mark.asyncio
-    async def test_delete_summary_not_found(self, vector_store):
-        """Test deleting a non-existent summary."""
-        task_id = "non-existent-task"
+    async def test_delete_summary_error(self, vector_store):
+        """Test deleting when the store raises."""
+        task_id = "test-task-123"
         
-        # Mock no documents found
-        vector_store.collection.get.return_value = {"ids": []}
+        vector_store.collection.delete.side_effect = Exception("Delete failed")
         
         result = await vector_store.delete_summary(task_id)
         
         assert result is False
-        vector_store.collection.delete.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_health_check_healthy(self, vector_store):
         """Test health check when service is healthy."""
         vector_store.collection.count.return_value = 50
@@ -210,7 +230,6 @@ class TestVectorStore:
         assert health["document_count"] == 50
         assert "collection_name" in health
 
-    @pytest.mark.asyncio
     async def test_health_check_unhealthy(self, vector_store):
         """Test health check when service is unhealthy."""
         vector_store.collection.count.side_effect = Exception("Connection failed")
@@ -220,41 +239,49 @@ class TestVectorStore:
         assert health["status"] == "unhealthy"
         assert "error" in health
 
-    @pytest.mark.asyncio
-    async def test_get_vector_store_singleton(self):
+    async def test_get_vector_store_singleton(self, monkeypatch):
         """Test that get_vector_store returns the same instance."""
-        with patch('transcript_summarizer.storage.vector_store.VectorStore') as mock_vector_store_class:
-            mock_instance = MagicMock()
-            mock_vector_store_class.return_value = mock_instance
-            
-            # Clear the global instance
-            import transcript_summarizer.storage.vector_store as vs_module
-            vs_module._vector_store_instance = None
-            
-            store1 = await get_vector_store()
-            store2 = await get_vector_store()
-            
-            assert store1 is store2
-            mock_vector_store_class.assert_called_once()
+        mock_instance = MagicMock()
+        mock_instance._initialize_client = AsyncMock()
+        mock_class = MagicMock(return_value=mock_instance)
+        monkeypatch.setattr(
+            'transcript_summarizer.storage.vector_store.VectorStore', mock_class
+        )
+        # monkeypatch restores the previous singleton on teardown, so
+        # this test no longer clobbers module state other tests see
+        monkeypatch.setattr(
+            'transcript_summarizer.storage.vector_store._vector_store_instance', None
+        )
+        
+        store1 = await get_vector_store()
+        store2 = await get_vector_store()
+        
+        assert store1 is store2
+        mock_class.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_store_summary_error_handling(self, vector_store, sample_result):
         """Test error handling when storing summary fails."""
         task_id = "test-task-123"
         original_text = "Test text"
         
-        # Mock ChromaDB to raise an exception
-        vector_store.collection.add.side_effect = Exception("Storage failed")
+        # Raise directly instead of routing through AsyncMock's
+        # side_effect machinery
+        async def _boom(*args, **kwargs):
+            raise Exception("Storage failed")
+
+        vector_store.collection.add = _boom
         
         with pytest.raises(Exception) as exc_info:
             await vector_store.store_summary(task_id, original_text, sample_result)
         
         assert "Storage failed" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_search_error_handling(self, vector_store):
         """Test error handling when search fails."""
-        vector_store.collection.query.side_effect = Exception("Query failed")
+        async def _boom(*args, **kwargs):
+            raise Exception("Query failed")
+
+        vector_store.collection.query = _boom
         
         results = await vector_store.search_similar_summaries("test query")
         